@@ -0,0 +1,8 @@
+"""Shared upstream HTTP clients."""
+
+from .pool import ClientPool, client_pool
+
+__all__ = [
+    "ClientPool",
+    "client_pool",
+]
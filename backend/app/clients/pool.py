@@ -0,0 +1,147 @@
+"""
+Process-wide pool of upstream HTTP clients.
+
+Every session leases the provider client it needs from one pool instead of
+opening its own, so the total number of sockets to each provider stays
+bounded no matter how many calls are active.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Set
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ClientLease:
+    """A session's hold on one of the pool's provider clients."""
+
+    __slots__ = ("_pool", "name", "_released")
+
+    def __init__(self, pool: "ClientPool", name: str):
+        self._pool = pool
+        self.name = name
+        self._released = False
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client for this lease's provider."""
+        return self._pool.get(self.name)
+
+    def release(self):
+        """Return the lease to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self.name)
+
+
+class ClientPool:
+    """
+    Shared HTTP/2 clients, one per upstream provider, with explicit limits.
+
+    Features:
+    - At most max_connections sockets per provider across all sessions
+    - Keep-alive connections expire after idle_timeout seconds
+    - A provider's client is closed once no session has leased it for
+      idle_timeout seconds
+    """
+
+    def __init__(self, max_connections: int = 20, idle_timeout: float = 60.0):
+        """
+        Initialize the pool.
+
+        Args:
+            max_connections: Maximum concurrent connections per provider
+            idle_timeout: Seconds before idle connections (and unleased
+                clients) are closed
+        """
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._leases: Dict[str, int] = {}
+        self._reapers: Dict[str, asyncio.TimerHandle] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    def acquire(self, name: str) -> ClientLease:
+        """
+        Lease the client for a provider.
+
+        Args:
+            name: Provider name (e.g. "openai", "elevenlabs")
+
+        Returns:
+            Lease to hold for the session's lifetime and release at the end
+        """
+        self._leases[name] = self._leases.get(name, 0) + 1
+        reaper = self._reapers.pop(name, None)
+        if reaper is not None:
+            reaper.cancel()
+        return ClientLease(self, name)
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        Get the shared client for a provider, creating it on first use.
+
+        Must be called inside the running event loop.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Shared HTTP client
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_connections,
+                    max_connections=self.max_connections,
+                    keepalive_expiry=self.idle_timeout,
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            )
+            self._clients[name] = client
+        return client
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of active leases per provider."""
+        return dict(self._leases)
+
+    async def close(self):
+        """Close every client (called on application shutdown)."""
+        for reaper in self._reapers.values():
+            reaper.cancel()
+        self._reapers.clear()
+
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            if not client.is_closed:
+                await client.aclose()
+
+    def _release(self, name: str):
+        """Drop a lease; schedule the client's reaping when none remain."""
+        remaining = self._leases.get(name, 0) - 1
+        self._leases[name] = max(remaining, 0)
+        if remaining <= 0 and name in self._clients:
+            loop = asyncio.get_running_loop()
+            self._reapers[name] = loop.call_later(self.idle_timeout, self._reap, name)
+
+    def _reap(self, name: str):
+        """Close a provider's client if it is still unleased."""
+        self._reapers.pop(name, None)
+        if self._leases.get(name, 0) > 0:
+            return
+        client: Optional[httpx.AsyncClient] = self._clients.pop(name, None)
+        if client is not None and not client.is_closed:
+            logger.debug(f"Closing idle {name} HTTP client")
+            task = asyncio.get_running_loop().create_task(client.aclose())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+
+# Global pool instance
+client_pool = ClientPool()
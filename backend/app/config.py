@@ -3,6 +3,7 @@ Configuration management using Pydantic Settings.
 Loads all environment variables with validation.
 """
 
+from dataclasses import make_dataclass
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
@@ -196,3 +197,14 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+# Read-only, slotted snapshot of the validated settings for hot paths.
+# Attribute reads are plain slot loads instead of going through the
+# Pydantic model; ``settings`` stays available for cold paths.
+_FrozenSettings = make_dataclass(
+    "_FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+frozen = _FrozenSettings(**settings.model_dump())
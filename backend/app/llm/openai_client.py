@@ -8,18 +8,95 @@ Supports:
 
 import asyncio
 import logging
-import re
-from typing import AsyncGenerator, Optional, Callable
-import json
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Optional, Callable
+import httpx
+import orjson
+import tiktoken
 from websockets import connect, WebSocketClientProtocol
 from websockets.exceptions import WebSocketException
 
-from app.config import settings
+from app.clients import client_pool
+from app.llm.sentence_splitter import SentenceSplitter
+from app.utils.cancel import CancelToken
+from app.config import frozen as settings
 
 logger = logging.getLogger(__name__)
 
-# Sentence boundary pattern: ends with .!? followed by space or end
-SENTENCE_END_PATTERN = re.compile(r'[.!?](?:\s|$)')
+# Settings are immutable at runtime - resolve them once at import
+_API_KEY = settings.openai_api_key
+_MODEL = settings.openai_model
+_BASE_URL = "https://api.openai.com/v1/chat/completions"
+_MODELS_URL = "https://api.openai.com/v1/models"
+_USE_PRIORITY = settings.openai_use_priority_api
+_ORG = settings.openai_organization_id
+_PROJ = settings.openai_project_id
+
+# Request headers, built once per process from the settings above
+_HEADERS = {
+    "Authorization": f"Bearer {_API_KEY}",
+    "Content-Type": "application/json",
+}
+# Add priority API headers
+if _USE_PRIORITY:
+    _HEADERS["x-stainless-priority"] = "high"
+# Add organization and project IDs if provided
+if _ORG:
+    _HEADERS["OpenAI-Organization"] = _ORG
+if _PROJ:
+    _HEADERS["OpenAI-Project"] = _PROJ
+
+# Translation table that deletes sentence-ending punctuation
+_PUNCT_TABLE = str.maketrans('', '', '.!?')
+
+
+async def _iter_sse_payloads(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """
+    Yield the `data:` payload of each Server-Sent Event in a response body.
+
+    Consumes the body as it arrives and splits complete events (terminated
+    by a blank line) out of a bytearray accumulator, so a burst of small
+    token events costs one read instead of one line read per event.
+    Stops at the `[DONE]` sentinel.
+
+    Args:
+        chunks: Response body chunks (`response.aiter_bytes()`)
+
+    Yields:
+        Raw JSON payload bytes for each data line
+    """
+    buf = bytearray()
+    async for chunk in chunks:
+        buf.extend(chunk)
+        start = 0
+        while (idx := buf.find(b'\n\n', start)) != -1:
+            event = bytes(buf[start:idx])
+            start = idx + 2
+            for line in event.split(b'\n'):
+                if not line.startswith(b'data: '):
+                    continue
+                data_bytes = line[6:].rstrip()  # Remove 'data: ' prefix
+                if data_bytes == b'[DONE]':
+                    return
+                yield data_bytes
+        if start:
+            del buf[:start]
+
+    # Trailing event without a terminating blank line
+    for line in bytes(buf).split(b'\n'):
+        if line.startswith(b'data: '):
+            data_bytes = line[6:].rstrip()
+            if data_bytes == b'[DONE]':
+                return
+            yield data_bytes
+
+
+class OpenAIStreamError(Exception):
+    """Raised when the chat completions endpoint returns a non-200 status."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"OpenAI API error {status_code}")
+        self.status_code = status_code
 
 
 class OpenAIClient:
@@ -31,20 +108,133 @@ class OpenAIClient:
     - Punctuation detection for TTS handoff
     - Token counting for cost tracking
     - Single retry on failure (5s timeout)
+    - Pooled HTTP/2 client shared by all sessions (no TCP/TLS handshake per turn)
     """
 
     def __init__(self):
-        self.api_key = settings.openai_api_key
-        self.model = settings.openai_model
-        self.base_url = "https://api.openai.com/v1/chat/completions"
-        self.organization_id = settings.openai_organization_id
-        self.project_id = settings.openai_project_id
-        self.use_priority_api = settings.openai_use_priority_api
+        self.api_key = _API_KEY
+        self.model = _MODEL
+        self.base_url = _BASE_URL
+        self.organization_id = _ORG
+        self.project_id = _PROJ
+        self.use_priority_api = _USE_PRIORITY
+
+        # Request headers are fixed by config; shared by every client (read-only)
+        self._base_headers = _HEADERS
+
+        # Static request body; `messages` is filled in per call
+        self._payload_template = {
+            "model": self.model,
+            "stream": True,
+            "temperature": 0.7,
+            "max_tokens": 200,
+            # Final chunk carries exact token counts (no client-side counting)
+            "stream_options": {"include_usage": True},
+        }
+
+        # Lease on the process-wide HTTP client
+        self._lease = client_pool.acquire("openai")
+
+        # BPE tokenizer for token counting (loaded on first use)
+        self._enc: Optional[tiktoken.Encoding] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client.
+
+        The pool uses HTTP/2, so concurrent sessions multiplex their streams
+        over a small number of kept-alive connections to api.openai.com.
+        """
+        return self._lease.client
+
+    def close(self):
+        """Return the pooled client lease (called when the session ends)."""
+        self._lease.release()
+
+    async def ping(self) -> bool:
+        """
+        Open (or refresh) the pooled HTTP/2 connection to OpenAI.
+
+        Issues a cheap HEAD request so the TCP/TLS handshake happens before
+        the first turn needs the LLM. The response status is ignored.
+
+        Returns:
+            True if the connection was established, False otherwise
+        """
+        try:
+            await self._get_client().head(_MODELS_URL, headers=self._base_headers)
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"OpenAI pre-warm failed: {e}")
+            return False
+
+    async def _iter_deltas(
+        self,
+        messages: list[dict],
+        cancel: CancelToken,
+    ) -> AsyncGenerator[tuple[Optional[str], Optional[dict]], None]:
+        """
+        Stream a chat completion and yield its parsed deltas.
+
+        Owns the request, SSE parsing and cancellation checks shared by
+        generate_response and stream_sentences. Stops quietly when
+        cancel is signalled; callers check the token afterwards.
+
+        Args:
+            messages: Full chat message list (system/user/assistant)
+            cancel: Token signalling cancellation
+
+        Yields:
+            Tuple of (content, usage) - content for token deltas, usage for
+            the final usage chunk (the other element is None)
+
+        Raises:
+            OpenAIStreamError: If the API responds with a non-200 status
+        """
+        payload = {**self._payload_template, "messages": messages}
+        client = self._get_client()
+
+        logger.info("Starting LLM stream: model=%s, priority=%s", self.model, self.use_priority_api)
+
+        async with client.stream(
+            "POST",
+            self.base_url,
+            headers=self._base_headers,
+            json=payload
+        ) as response:
+
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode(errors="replace")
+                logger.error(f"\u274c OpenAI API error {response.status_code}: {error_text}")
+                logger.error(f"   Request: model={self.model}, messages={len(messages)}, priority={self.use_priority_api}")
+                raise OpenAIStreamError(response.status_code)
+
+            async for data_bytes in _iter_sse_payloads(response.aiter_bytes()):
+                # Check for cancellation
+                if cancel.cancelled:
+                    return
+
+                try:
+                    data = orjson.loads(data_bytes)
+                except orjson.JSONDecodeError as e:
+                    logger.warning("Failed to parse SSE data: %s", e)
+                    continue
+
+                choices = data.get('choices')
+                if choices:
+                    content = choices[0].get('delta', {}).get('content')
+                    if content:
+                        yield (content, None)
+
+                # Usage info (sent in last chunk)
+                usage = data.get('usage')
+                if usage:
+                    yield (None, usage)
 
     async def generate_response(
         self,
         messages: list[dict],
-        cancel_event: asyncio.Event,
+        cancel: CancelToken,
         on_token: Optional[Callable[[str], None]] = None,
     ) -> Optional[tuple[str, int, int]]:
         """
@@ -52,118 +242,107 @@ class OpenAIClient:
 
         Args:
             messages: Full chat message list (system/user/assistant)
-            cancel_event: Event to signal cancellation
+            cancel: Token signalling cancellation
             on_token: Optional callback for each token (for streaming to TTS)
 
         Returns:
             Tuple of (full_response, prompt_tokens, completion_tokens) or None if cancelled
         """
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": True,
-            "temperature": 0.7,
-            "max_tokens": 200,
-        }
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        
-        # Add priority API headers
-        if self.use_priority_api:
-            headers["x-stainless-priority"] = "high"
-        
-        # Add organization and project IDs if provided
-        if self.organization_id:
-            headers["OpenAI-Organization"] = self.organization_id
-        if self.project_id:
-            headers["OpenAI-Project"] = self.project_id
-
         full_response = ""
         prompt_tokens = 0
         completion_tokens = 0
-        first_token_received = False
 
-        try:
-            # Use aiohttp or httpx for streaming
-            import aiohttp
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=5)
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"OpenAI API error {response.status}: {error_text}")
-                        return None
-
-                    # Stream tokens
-                    async for line in response.content:
-                        # Check for cancellation
-                        if cancel_event.is_set():
-                            logger.info("LLM generation cancelled")
-                            return None
-
-                        line = line.decode('utf-8').strip()
-                        if not line or not line.startswith('data: '):
-                            continue
-
-                        data_str = line[6:]  # Remove 'data: ' prefix
-                        
-                        if data_str == '[DONE]':
-                            break
+        # Hand tokens to a consumer task so a slow callback never stalls SSE reads
+        token_queue: Optional[asyncio.Queue] = None
+        consumer: Optional[asyncio.Task] = None
+        if on_token:
+            token_queue = asyncio.Queue(maxsize=64)
+            consumer = asyncio.create_task(self._drain_tokens(token_queue, on_token))
+        completed = False
 
+        try:
+            async with aclosing(self._iter_deltas(messages, cancel)) as deltas:
+                # Log first token to verify streaming, then enter the hot loop
+                # below without a per-token first-token check
+                async for content, usage in deltas:
+                    if usage is not None:
+                        prompt_tokens = usage.get('prompt_tokens', 0)
+                        completion_tokens = usage.get('completion_tokens', completion_tokens)
+                        continue
+                    logger.info("✅ LLM streaming: First token received ('%s')", content)
+                    full_response = content
+                    completion_tokens = 1
+                    if token_queue is not None:
+                        token_queue.put_nowait(content)
+                    break
+
+                async for content, usage in deltas:
+                    if usage is not None:
+                        prompt_tokens = usage.get('prompt_tokens', 0)
+                        completion_tokens = usage.get('completion_tokens', completion_tokens)
+                        continue
+
+                    full_response += content
+                    completion_tokens += 1
+
+                    # Stream token to TTS
+                    if token_queue is not None:
                         try:
-                            data = json.loads(data_str)
-                            
-                            # Extract token
-                            if 'choices' in data and len(data['choices']) > 0:
-                                delta = data['choices'][0].get('delta', {})
-                                content = delta.get('content', '')
-                                
-                                if content:
-                                    full_response += content
-                                    completion_tokens += 1
-                                    
-                                    # Log first token to verify streaming
-                                    if not first_token_received:
-                                        first_token_received = True
-                                        logger.info(f"✅ LLM streaming: First token received ('{content}')")
-                                    
-                                    # Stream token to TTS
-                                    if on_token:
-                                        on_token(content)
-
-                            # Extract usage info (sent in last chunk)
-                            if 'usage' in data:
-                                prompt_tokens = data['usage'].get('prompt_tokens', 0)
-                                completion_tokens = data['usage'].get('completion_tokens', completion_tokens)
-
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse SSE data: {e}")
-                            continue
-
-            logger.info(f"LLM generation complete: {len(full_response)} chars, {completion_tokens} tokens")
+                            token_queue.put_nowait(content)
+                        except asyncio.QueueFull:
+                            await token_queue.put(content)
+
+            if cancel.cancelled:
+                logger.info("LLM generation cancelled")
+                return None
+
+            completed = True
+            logger.info("LLM generation complete: %d chars, %d tokens", len(full_response), completion_tokens)
             return (full_response, prompt_tokens, completion_tokens)
 
         except asyncio.CancelledError:
             logger.info("LLM generation task cancelled")
             return None
+        except OpenAIStreamError:
+            return None
         except Exception as e:
             logger.error(f"Error during LLM generation: {e}")
             return None
+        finally:
+            if consumer is not None:
+                if completed:
+                    # Let the consumer deliver every queued token before returning
+                    await token_queue.put(None)
+                    await consumer
+                else:
+                    consumer.cancel()
+
+    @staticmethod
+    async def _drain_tokens(
+        token_queue: asyncio.Queue,
+        on_token: Callable[[str], None],
+    ):
+        """
+        Deliver queued tokens to the on_token callback until a None sentinel.
+
+        Args:
+            token_queue: Queue filled by generate_response's stream loop
+            on_token: Callback invoked once per token
+        """
+        while True:
+            token = await token_queue.get()
+            if token is None:
+                break
+            try:
+                on_token(token)
+            except Exception as e:
+                logger.error(f"Error in on_token callback: {e}")
 
     async def stream_sentences(
         self,
         messages: list[dict],
-        cancel_event: asyncio.Event,
+        cancel: CancelToken,
+        usage: Optional[dict] = None,
     ) -> AsyncGenerator[tuple[str, bool], None]:
         """
         Stream sentences from OpenAI as they complete.
@@ -173,121 +352,61 @@ class OpenAIClient:
         
         Args:
             messages: Full chat message list (system/user/assistant)
-            cancel_event: Event to signal cancellation
+            cancel: Token signalling cancellation
+            usage: Per-call dict filled with the stream's usage chunk (left
+                empty if none is received)
             
         Yields:
             Tuple of (sentence_text, is_final) - is_final=True on last sentence
         """
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": True,
-            "temperature": 0.7,
-            "max_tokens": 200,
-        }
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        
-        # Add priority API headers
-        if self.use_priority_api:
-            headers["x-stainless-priority"] = "high"
-        
-        # Add organization and project IDs if provided
-        if self.organization_id:
-            headers["OpenAI-Organization"] = self.organization_id
-        if self.project_id:
-            headers["OpenAI-Project"] = self.project_id
-
-        sentence_buffer = ""
-        first_token_received = False
+        splitter = SentenceSplitter()
         total_tokens = 0
+        if usage is None:
+            usage = {}
 
         try:
-            import aiohttp
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=5)
-            
-            logger.info(f"\ud83d\ude80 Starting LLM stream_sentences: model={self.model}, priority={self.use_priority_api}")
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"\u274c OpenAI API error {response.status}: {error_text}")
-                        logger.error(f"   Request: model={self.model}, messages={len(messages)}, priority={self.use_priority_api}")
-                        return
-
-                    logger.info(f"\u2705 OpenAI stream_sentences: Connection established (HTTP 200)")
-
-                    # Stream tokens and yield sentences
-                    async for line in response.content:
-                        # Check for cancellation
-                        if cancel_event.is_set():
-                            logger.info("LLM sentence streaming cancelled")
-                            return
-
-                        line = line.decode('utf-8').strip()
-                        if not line or not line.startswith('data: '):
-                            continue
-
-                        data_str = line[6:]  # Remove 'data: ' prefix
-                        
-                        if data_str == '[DONE]':
-                            break
-
-                        try:
-                            data = json.loads(data_str)
-                            
-                            if 'choices' in data and len(data['choices']) > 0:
-                                delta = data['choices'][0].get('delta', {})
-                                content = delta.get('content', '')
-                                
-                                if content:
-                                    sentence_buffer += content
-                                    total_tokens += 1
-                                    
-                                    # Log first token
-                                    if not first_token_received:
-                                        first_token_received = True
-                                        logger.info(f"✅ LLM streaming: First token received ('{content}')")
-                                    
-                                    # Check for sentence boundary
-                                    # Look for .!? followed by space or at end of buffer
-                                    match = SENTENCE_END_PATTERN.search(sentence_buffer)
-                                    if match:
-                                        # Extract complete sentence(s)
-                                        end_pos = match.end()
-                                        sentence = sentence_buffer[:end_pos].strip()
-                                        sentence_buffer = sentence_buffer[end_pos:].lstrip()
-                                        
-                                        if sentence:
-                                            logger.info(f"📝 Yielding sentence ({len(sentence)} chars): {sentence[:50]}...")
-                                            yield (sentence, False)  # Not final yet
-
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse SSE data: {e}")
-                            continue
+            async with aclosing(self._iter_deltas(messages, cancel)) as deltas:
+                # Wait for the first token outside the hot loop so the loop
+                # below carries no first-token check
+                async for content, chunk_usage in deltas:
+                    if content is None:
+                        usage.update(chunk_usage)
+                        continue
+                    logger.info("✅ LLM streaming: First token received ('%s')", content)
+                    total_tokens = 1
+                    for sentence in splitter.try_emit(content):
+                        logger.debug("Yielding sentence (%d chars): %.50s", len(sentence), sentence)
+                        yield (sentence, False)  # Not final yet
+                    break
+
+                async for content, chunk_usage in deltas:
+                    if content is None:
+                        usage.update(chunk_usage)
+                        continue
+
+                    total_tokens += 1
+                    for sentence in splitter.try_emit(content):
+                        logger.debug("Yielding sentence (%d chars): %.50s", len(sentence), sentence)
+                        yield (sentence, False)  # Not final yet
+
+            if cancel.cancelled:
+                logger.info("LLM sentence streaming cancelled")
+                return
 
             # Yield any remaining text as final sentence
-            if sentence_buffer.strip():
-                final_sentence = sentence_buffer.strip()
-                logger.info(f"📝 Yielding final sentence ({len(final_sentence)} chars): {final_sentence[:50]}...")
+            final_sentence = splitter.flush()
+            if final_sentence:
+                logger.debug("Yielding final sentence (%d chars): %.50s", len(final_sentence), final_sentence)
                 yield (final_sentence, True)
             
-            logger.info(f"LLM sentence streaming complete: {total_tokens} tokens")
+            logger.info("LLM sentence streaming complete: %d tokens", total_tokens)
 
         except asyncio.CancelledError:
             logger.info("LLM sentence streaming task cancelled")
             return
-        except aiohttp.ClientError as e:
+        except OpenAIStreamError:
+            return
+        except httpx.HTTPError as e:
             logger.error(f"\u274c OpenAI network error: {e}")
             return
         except Exception as e:
@@ -296,11 +415,13 @@ class OpenAIClient:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return
 
-    async def detect_sentence_boundary(self, text: str) -> bool:
+    @staticmethod
+    def detect_sentence_boundary(text: str) -> bool:
         """
         Check if text contains sentence-ending punctuation.
         
         Used to determine when to start TTS (wait for first complete sentence).
+        Single C-level pass: deleting .?! changes the length iff one is present.
         
         Args:
             text: Accumulated text to check
@@ -308,16 +429,26 @@ class OpenAIClient:
         Returns:
             True if contains sentence boundary (.?!)
         """
-        return any(punct in text for punct in ['.', '?', '!'])
+        return len(text.translate(_PUNCT_TABLE)) != len(text)
+
+    def _get_encoding(self) -> tiktoken.Encoding:
+        """Get the tokenizer for the configured model, loading it on first use."""
+        if self._enc is None:
+            try:
+                self._enc = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                # Model unknown to this tiktoken version
+                self._enc = tiktoken.get_encoding("cl100k_base")
+        return self._enc
 
     def estimate_prompt_tokens(self, text: str) -> int:
         """
-        Rough estimation of token count (1 token ≈ 4 chars).
+        Count tokens in text using the model's BPE tokenizer.
         
         Args:
             text: Text to estimate
             
         Returns:
-            Estimated token count
+            Token count
         """
-        return len(text) // 4
+        return len(self._get_encoding().encode(text, disallowed_special=()))
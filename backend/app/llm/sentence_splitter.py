@@ -0,0 +1,82 @@
+"""
+Incremental sentence segmentation for streamed LLM output.
+
+Tokens are fed in as they arrive and complete sentences come out as soon as
+their boundary is seen, enabling TTS to start before the response completes.
+"""
+
+from typing import List
+
+# Sentence-ending punctuation
+_SENTENCE_END_CHARS = frozenset('.!?')
+
+
+class SentenceSplitter:
+    """
+    Two-state DFA that splits a token stream into sentences.
+
+    States:
+    - TEXT: inside a sentence
+    - PUNCT: just saw .!? (possibly several, e.g. "?!" or "...")
+
+    Whitespace in PUNCT ends the sentence; any other character returns to
+    TEXT. The state carries across tokens, so every character is examined
+    exactly once and a boundary split over two tokens ("Hello." + " Next")
+    is still found. Tokens with no punctuation skip the scan entirely.
+    """
+
+    __slots__ = ("_parts", "_in_punct")
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._in_punct = False
+
+    def try_emit(self, chunk: str) -> List[str]:
+        """
+        Feed a token and collect the sentences it completes.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Completed sentences (stripped, non-empty), in order
+        """
+        # Fast path: most tokens contain no punctuation
+        if not self._in_punct and not ('.' in chunk or '!' in chunk or '?' in chunk):
+            self._parts.append(chunk)
+            return []
+
+        sentences = []
+        start = 0
+        in_punct = self._in_punct
+        for i, ch in enumerate(chunk):
+            if ch in _SENTENCE_END_CHARS:
+                in_punct = True
+            elif in_punct and ch.isspace():
+                # PUNCT --whitespace--> boundary: emit and restart in TEXT
+                self._parts.append(chunk[start:i])
+                sentence = ''.join(self._parts).strip()
+                self._parts.clear()
+                if sentence:
+                    sentences.append(sentence)
+                start = i + 1
+                in_punct = False
+            else:
+                in_punct = False
+
+        self._in_punct = in_punct
+        if start < len(chunk):
+            self._parts.append(chunk[start:])
+        return sentences
+
+    def flush(self) -> str:
+        """
+        Take whatever text is left (the final, possibly unterminated sentence).
+
+        Returns:
+            Remaining text, stripped (empty if none)
+        """
+        remainder = ''.join(self._parts).strip()
+        self._parts.clear()
+        self._in_punct = False
+        return remainder
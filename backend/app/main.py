@@ -3,20 +3,24 @@ FastAPI application entry point.
 Sets up CORS, health check, and WebSocket endpoint.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Dict, Optional
 import httpx
+import orjson
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.config import settings
-from app.websocket import connection_manager
+from app.config import frozen, settings
+from app.websocket import ConnectionManager, connection_manager
 from app.db.postgres import db
 from app.db.models import Session
 from app.orchestration.turn_controller import TurnController
+from app.state_machine import TurnState
+from app.clients import client_pool
 from app.debug_logger import debug_logger
 from app.api.documents import router as documents_router
 import time
@@ -29,6 +33,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Preserialized constant replies
+_PONG_TEXT = orjson.dumps({"type": "pong", "data": {}}).decode()
+
+# Cached database health for /health (refreshed in the background when stale)
+_DB_HEALTH_TTL = 2.0  # seconds
+_db_health = {"ok": False, "ts": 0.0}
+_db_health_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_db_health() -> bool:
+    """Probe the database and update the cached health status."""
+    try:
+        ok = await db.health_check()
+    except Exception as e:
+        logger.warning(f"Database health probe failed: {e}")
+        ok = False
+    _db_health["ok"] = ok
+    _db_health["ts"] = time.monotonic()
+    return ok
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -40,6 +64,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Voice AI Pipeline backend starting...")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Host: {settings.host}:{settings.port}")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     logger.info(f"Frontend URL: {settings.frontend_url}")
     logger.info(f"OpenAI Model: {settings.openai_model}")
     logger.info(f"Min silence debounce: {settings.min_silence_debounce_ms}ms")
@@ -51,7 +76,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database
     try:
         db.init_engine()
-        db_healthy = await db.health_check()
+        db_healthy = await _refresh_db_health()
         if db_healthy:
             logger.info("Database connection healthy")
         else:
@@ -64,6 +89,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Voice AI Pipeline backend shutting down...")
+    await client_pool.close()
     await db.close()
 
 
@@ -93,9 +119,15 @@ async def health_check() -> JSONResponse:
     """
     Health check endpoint.
     Returns 200 OK if server is running.
-    Includes database health status.
+    Includes database health status (cached for up to 2s, never awaited here).
     """
-    db_healthy = await db.health_check()
+    global _db_health_task
+    
+    # Serve the cached status; kick off a refresh if it is stale
+    if time.monotonic() - _db_health["ts"] > _DB_HEALTH_TTL:
+        if _db_health_task is None or _db_health_task.done():
+            _db_health_task = asyncio.create_task(_refresh_db_health())
+    db_healthy = _db_health["ok"]
     
     return JSONResponse(
         status_code=200,
@@ -168,6 +200,176 @@ async def get_debug_reports(limit: int = 20, ios_only: bool = False) -> JSONResp
         )
 
 
+class _WSCallbacks:
+    """
+    TurnController callbacks for one WebSocket session.
+    
+    Each method returns the ConnectionManager send coroutine, which the
+    TurnController awaits.
+    """
+    
+    __slots__ = ("session_id", "connection_manager")
+    
+    def __init__(self, session_id: str, manager: ConnectionManager):
+        self.session_id = session_id
+        self.connection_manager = manager
+    
+    def on_state_change(self, from_state: TurnState, to_state: TurnState) -> Awaitable[None]:
+        return self.connection_manager.send_state_change(
+            self.session_id, from_state.value, to_state.value
+        )
+    
+    def on_transcript_partial(self, text: str, confidence: float) -> Awaitable[bool]:
+        return self.connection_manager.send_event(
+            self.session_id,
+            "transcript_partial",
+            {
+                "text": text,
+                "confidence": confidence,
+                "timestamp": int(time.time() * 1000)
+            }
+        )
+    
+    def on_transcript_final(self, text: str, confidence: float) -> Awaitable[bool]:
+        return self.connection_manager.send_event(
+            self.session_id,
+            "transcript_final",
+            {
+                "text": text,
+                "confidence": confidence,
+                "timestamp": int(time.time() * 1000)
+            }
+        )
+    
+    def on_agent_audio(self, audio_b64: str, chunk_index: int, is_final: bool) -> Awaitable[bool]:
+        return self.connection_manager.send_event(
+            self.session_id,
+            "agent_audio_chunk",
+            {
+                "audio": audio_b64,
+                "chunk_index": chunk_index,
+                "is_final": is_final
+            }
+        )
+    
+    def on_agent_text_fallback(self, text: str, reason: str) -> Awaitable[bool]:
+        return self.connection_manager.send_event(
+            self.session_id,
+            "agent_text_fallback",
+            {"text": text, "reason": reason}
+        )
+    
+    def on_turn_complete(
+        self,
+        turn_id: str,
+        user_text: str,
+        agent_text: str,
+        duration_ms: int,
+        was_interrupted: bool,
+        timings: Dict[str, int],
+    ) -> Awaitable[bool]:
+        return self.connection_manager.send_event(
+            self.session_id,
+            "turn_complete",
+            {
+                "turn_id": turn_id,
+                "user_text": user_text,
+                "agent_text": agent_text,
+                "duration_ms": duration_ms,
+                "was_interrupted": was_interrupted,
+                "timings": timings,
+                "timestamp": int(time.time() * 1000)
+            }
+        )
+    
+    def on_error(self, code: str, message: str, recoverable: bool) -> Awaitable[None]:
+        return self.connection_manager.send_error(
+            self.session_id, code, message, recoverable
+        )
+
+
+async def _receive_messages(websocket: WebSocket, inbox: asyncio.Queue) -> None:
+    """
+    Read and parse client frames into the inbox queue.
+    
+    Frames are parsed with orjson (text or binary). The exception that ends
+    the loop (WebSocketDisconnect, invalid JSON) is queued last so the
+    message loop re-raises it in order.
+    """
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            raw = message.get("text")
+            await inbox.put(orjson.loads(raw if raw is not None else message["bytes"]))
+    except Exception as e:
+        await inbox.put(e)
+
+
+# WebSocket message handlers: (session_id, websocket, turn_controller, data) -> True to end session
+async def _handle_ping(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Respond to ping with pong."""
+    await websocket.send_text(_PONG_TEXT)
+    return False
+
+
+async def _handle_noop(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Ignore message (pong: heartbeat already updated, connect: handled during connection)."""
+    return False
+
+
+async def _handle_disconnect(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Client requested disconnect."""
+    logger.info(f"Session {session_id} requested disconnect")
+    return True
+
+
+async def _handle_interrupt(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """User interrupted agent speech."""
+    logger.info(f"Session {session_id} interrupted")
+    await turn_controller._handle_interrupt()
+    return False
+
+
+async def _handle_playback_complete(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Frontend finished playing all audio."""
+    logger.info(f"Session {session_id} playback complete")
+    await turn_controller.handle_playback_complete()
+    return False
+
+
+async def _handle_update_settings(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Update controller settings."""
+    turn_controller.update_settings(
+        silence_debounce_ms=data.get("silence_debounce_ms"),
+        cancellation_threshold=data.get("cancellation_threshold"),
+        adaptive_debounce_enabled=data.get("adaptive_debounce_enabled"),
+    )
+    return False
+
+
+async def _handle_text_input(session_id: str, websocket: WebSocket, turn_controller: TurnController, data: dict) -> bool:
+    """Handle text input (for testing without microphone)."""
+    text = data.get("text", "")
+    if text:
+        logger.info(f"Session {session_id} text input: {text}")
+        await turn_controller.handle_text_input(text)
+    return False
+
+
+_MESSAGE_HANDLERS = {
+    "ping": _handle_ping,
+    "pong": _handle_noop,
+    "disconnect": _handle_disconnect,
+    "interrupt": _handle_interrupt,
+    "playback_complete": _handle_playback_complete,
+    "update_settings": _handle_update_settings,
+    "text_input": _handle_text_input,
+    "connect": _handle_noop,
+}
+
+
 @app.websocket("/ws/voice")
 async def voice_websocket(websocket: WebSocket) -> None:
     """
@@ -184,12 +386,29 @@ async def voice_websocket(websocket: WebSocket) -> None:
     """
     session_id = None
     turn_controller = None
+    receive_task = None
     
     try:
         # Accept connection and create session
         session_id = await connection_manager.connect(websocket)
         logger.info(f"New voice session: {session_id}")
         
+        # Initialize Turn Controller with callbacks
+        callbacks = _WSCallbacks(session_id, connection_manager)
+        turn_controller = TurnController(
+            session_id=session_id,
+            on_state_change=callbacks.on_state_change,
+            on_transcript_partial=callbacks.on_transcript_partial,
+            on_transcript_final=callbacks.on_transcript_final,
+            on_agent_audio=callbacks.on_agent_audio,
+            on_agent_text_fallback=callbacks.on_agent_text_fallback,
+            on_turn_complete=callbacks.on_turn_complete,
+            on_error=callbacks.on_error,
+        )
+        
+        # Pre-warm upstream connections while the session record is written
+        warm_up_task = asyncio.create_task(turn_controller.warm_up())
+        
         # Create session record in database
         try:
             async with db.get_session() as db_session:
@@ -210,70 +429,7 @@ async def voice_websocket(websocket: WebSocket) -> None:
         except Exception as e:
             logger.warning(f"Failed to create session record: {e} - continuing without DB tracking")
         
-        # Initialize Turn Controller with callbacks
-        turn_controller = TurnController(
-            session_id=session_id,
-            on_state_change=lambda from_state, to_state: connection_manager.send_state_change(
-                session_id, from_state.value, to_state.value
-            ),
-            on_transcript_partial=lambda text, confidence: connection_manager.send_message(
-                session_id,
-                {
-                    "type": "transcript_partial",
-                    "data": {
-                        "text": text,
-                        "confidence": confidence,
-                        "timestamp": int(time.time() * 1000)
-                    }
-                }
-            ),
-            on_transcript_final=lambda text, confidence: connection_manager.send_message(
-                session_id,
-                {
-                    "type": "transcript_final",
-                    "data": {
-                        "text": text,
-                        "confidence": confidence,
-                        "timestamp": int(time.time() * 1000)
-                    }
-                }
-            ),
-            on_agent_audio=lambda audio_b64, chunk_index, is_final: connection_manager.send_message(
-                session_id,
-                {
-                    "type": "agent_audio_chunk",
-                    "data": {
-                        "audio": audio_b64,
-                        "chunk_index": chunk_index,
-                        "is_final": is_final
-                    }
-                }
-            ),
-            on_agent_text_fallback=lambda text, reason: connection_manager.send_message(
-                session_id,
-                {
-                    "type": "agent_text_fallback",
-                    "data": {"text": text, "reason": reason}
-                }
-            ),
-            on_turn_complete=lambda turn_id, user_text, agent_text, duration_ms, was_interrupted: connection_manager.send_message(
-                session_id,
-                {
-                    "type": "turn_complete",
-                    "data": {
-                        "turn_id": turn_id,
-                        "user_text": user_text,
-                        "agent_text": agent_text,
-                        "duration_ms": duration_ms,
-                        "was_interrupted": was_interrupted,
-                        "timestamp": int(time.time() * 1000)
-                    }
-                }
-            ),
-            on_error=lambda code, message, recoverable: connection_manager.send_error(
-                session_id, code, message, recoverable
-            ),
-        )
+        await warm_up_task
         
         # Start Turn Controller
         await turn_controller.start()
@@ -290,80 +446,58 @@ async def voice_websocket(websocket: WebSocket) -> None:
                 vector_store, 
                 openai_client=doc_openai_client,
                 local_embedder=local_embedder,
-                use_local=settings.rag_use_local_embeddings
+                use_local=frozen.rag_use_local_embeddings
             )
             logger.info(f"RAG enabled for session {session_id}")
         except Exception as e:
             logger.warning(f"RAG initialization failed: {e} - continuing without RAG")
         
+        # Read frames in a separate task so that every message already received
+        # is handled in one loop turn (consecutive audio chunks are batched)
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=256)
+        receive_task = asyncio.create_task(_receive_messages(websocket, inbox))
+        
         # Message handling loop
         while True:
-            # Receive message from client
-            data = await websocket.receive_json()
-            message_type = data.get("type", "unknown")
-            message_data = data.get("data", {})
+            batch = [await inbox.get()]
+            while not inbox.empty():
+                batch.append(inbox.get_nowait())
             
-            logger.debug(f"Session {session_id} received: {message_type}")
+            logger.debug("Session %s received %d messages", session_id, len(batch))
             
-            # Update heartbeat
+            # Update heartbeat (once per batch)
             connection_manager.update_heartbeat(session_id)
             
-            # Route message by type
-            if message_type == "ping":
-                # Respond to ping with pong
-                await websocket.send_json({
-                    "type": "pong",
-                    "data": {}
-                })
-            
-            elif message_type == "pong":
-                # Client responded to our ping - heartbeat already updated
-                pass
+            end_session = False
+            audio_chunks: list[str] = []
+            for item in batch:
+                # Fast path for the dominant message type
+                if type(item) is dict and item.get("type") == "audio_chunk":
+                    audio_chunks.append(item.get("data", {}).get("audio", ""))
+                    continue
+                
+                # Preserve ordering: forward buffered audio before anything else
+                if audio_chunks:
+                    await turn_controller.handle_audio_batch(audio_chunks)
+                    audio_chunks = []
+                
+                # Receive loop ended (disconnect or invalid frame)
+                if isinstance(item, Exception):
+                    raise item
+                
+                # Route message by type
+                message_type = item.get("type", "unknown")
+                handler = _MESSAGE_HANDLERS.get(message_type)
+                if handler is None:
+                    logger.warning(f"Session {session_id} sent unknown message type: {message_type}")
+                elif await handler(session_id, websocket, turn_controller, item.get("data", {})):
+                    end_session = True
+                    break
             
-            elif message_type == "disconnect":
-                # Client requested disconnect
-                logger.info(f"Session {session_id} requested disconnect")
+            if end_session:
                 break
-            
-            elif message_type == "audio_chunk":
-                # Forward to Turn Controller
-                await turn_controller.handle_audio_chunk(
-                    audio_base64=message_data.get("audio", ""),
-                    format=message_data.get("format", "pcm"),
-                    sample_rate=message_data.get("sample_rate", 16000)
-                )
-            
-            elif message_type == "interrupt":
-                # User interrupted agent speech
-                logger.info(f"Session {session_id} interrupted")
-                await turn_controller._handle_interrupt()
-            
-            elif message_type == "playback_complete":
-                # Frontend finished playing all audio
-                logger.info(f"Session {session_id} playback complete")
-                await turn_controller.handle_playback_complete()
-            
-            elif message_type == "update_settings":
-                # Update controller settings
-                turn_controller.update_settings(
-                    silence_debounce_ms=message_data.get("silence_debounce_ms"),
-                    cancellation_threshold=message_data.get("cancellation_threshold"),
-                    adaptive_debounce_enabled=message_data.get("adaptive_debounce_enabled"),
-                )
-            
-            elif message_type == "text_input":
-                # Handle text input (for testing without microphone)
-                text = message_data.get("text", "")
-                if text:
-                    logger.info(f"Session {session_id} text input: {text}")
-                    await turn_controller.handle_text_input(text)
-            
-            elif message_type == "connect":
-                # Client sent connect message - already handled during connection
-                pass
-            
-            else:
-                logger.warning(f"Session {session_id} sent unknown message type: {message_type}")
+            if audio_chunks:
+                await turn_controller.handle_audio_batch(audio_chunks)
     
     except WebSocketDisconnect:
         logger.info(f"Session {session_id} disconnected")
@@ -379,6 +513,10 @@ async def voice_websocket(websocket: WebSocket) -> None:
             )
     
     finally:
+        # Stop reading frames
+        if receive_task:
+            receive_task.cancel()
+        
         # Cleanup session
         if turn_controller:
             await turn_controller.stop()
@@ -399,6 +537,7 @@ async def voice_websocket(websocket: WebSocket) -> None:
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
     uvicorn.run(
@@ -407,4 +546,6 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.is_development,
         log_level=settings.log_level.lower(),
+        # libuv-backed event loop (not available on Windows)
+        loop="uvloop" if sys.platform != "win32" else "auto",
     )
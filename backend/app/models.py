@@ -4,7 +4,7 @@ All message schemas are defined here as per api.md specification.
 """
 
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 from enum import Enum
 
 
@@ -328,6 +328,10 @@ class TurnCompleteData(BaseModel):
         ...,
         description="True if user interrupted"
     )
+    timings: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Turn latency breakdown in milliseconds (e.g. stt_ms, llm_ms, total_latency_ms)"
+    )
     timestamp: int = Field(
         ...,
         description="Unix timestamp in milliseconds"
@@ -351,6 +355,12 @@ class TelemetryData(BaseModel):
         le=1.0,
         description="Cancellation rate 0.0-1.0"
     )
+    cancellation_rate_ewma: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Recent cancellation rate (EWMA) driving the adaptive debounce"
+    )
     avg_debounce_ms: int = Field(
         ...,
         ge=0,
@@ -4,18 +4,30 @@ Conversation history buffer for maintaining turn-based context.
 Stores all prior user/assistant turns and exposes them as chat messages.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class ConversationHistory:
     """
     Tracks the full turn-based conversation history.
 
-    This buffer is unbounded to preserve all turns, as requested.
+    This buffer is unbounded to preserve all turns, as requested. The
+    prompt window over it is append-only: it grows from window_messages up
+    to twice that, then jumps forward to the newest window_messages. Between
+    jumps every prompt extends the previous one, so the prefix matches the
+    LLM provider's prompt cache (a sliding window would shift it each turn).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, window_messages: Optional[int] = None) -> None:
+        """
+        Initialize conversation history.
+
+        Args:
+            window_messages: Messages kept after a window jump (None = no window)
+        """
         self._messages: List[Dict[str, str]] = []
+        self._window_messages = window_messages
+        self._window_start = 0  # First message returned by get_window()
 
     def add_turn(self, user_text: str, assistant_text: str) -> None:
         """
@@ -30,6 +42,12 @@ class ConversationHistory:
         if assistant_text:
             self._messages.append({"role": "assistant", "content": assistant_text})
 
+        if (
+            self._window_messages
+            and len(self._messages) - self._window_start >= 2 * self._window_messages
+        ):
+            self._window_start = len(self._messages) - self._window_messages
+
     def get_messages(self) -> List[Dict[str, str]]:
         """
         Get the full message history.
@@ -39,6 +57,19 @@ class ConversationHistory:
         """
         return list(self._messages)
 
+    def get_window(self) -> List[Dict[str, str]]:
+        """
+        Get the messages to send with the next prompt.
+
+        Returns:
+            List of chat messages from the window start onwards
+        """
+        return self._messages[self._window_start:]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
     def clear(self) -> None:
         """Clear the conversation history."""
-        self._messages.clear()
\ No newline at end of file
+        self._messages.clear()
+        self._window_start = 0
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Sentence queue for LLM→TTS handoff.
+
+A minimal single-consumer queue: a deque plus an "item available" event.
+Unlike asyncio.Queue, it can be emptied in one call, which every
+cancellation path (barge-in, new turn, reset) needs.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Tuple
+
+# (sentence, is_final)
+SentenceItem = Tuple[str, bool]
+
+
+class SentenceQueue:
+    """
+    Unbounded queue of (sentence, is_final) items between LLM and TTS tasks.
+
+    Key Features:
+    - put_nowait() never blocks (the queue is unbounded)
+    - get() waits until an item is available
+    - drain() discards everything queued in O(1)
+    """
+
+    def __init__(self):
+        self._items: Deque[SentenceItem] = deque()
+        self._available = asyncio.Event()
+
+    def put_nowait(self, item: SentenceItem):
+        """
+        Append an item and wake the consumer.
+
+        Args:
+            item: (sentence, is_final) tuple
+        """
+        self._items.append(item)
+        self._available.set()
+
+    async def get(self) -> SentenceItem:
+        """
+        Remove and return the oldest item, waiting until one is available.
+
+        Returns:
+            (sentence, is_final) tuple
+        """
+        while not self._items:
+            self._available.clear()
+            await self._available.wait()
+        return self._items.popleft()
+
+    def drain(self):
+        """Discard all queued items."""
+        self._items.clear()
+        self._available.clear()
+
+    def empty(self) -> bool:
+        """Check if no items are queued."""
+        return not self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
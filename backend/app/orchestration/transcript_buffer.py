@@ -6,8 +6,8 @@ Final transcripts are accumulated and locked during COMMITTED state.
 """
 
 import logging
+import time
 from typing import List, Optional
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ class TranscriptEntry:
         self.text = text
         self.confidence = confidence
         self.is_final = is_final
-        self.timestamp = datetime.utcnow()
+        self.timestamp = time.monotonic_ns()
 
     def __repr__(self) -> str:
         return f"TranscriptEntry(text='{self.text[:30]}...', confidence={self.confidence:.2f}, is_final={self.is_final})"
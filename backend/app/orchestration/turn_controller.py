@@ -13,9 +13,12 @@ Critical: Input is conservative (buffered), output is aggressive (streamed/inter
 """
 
 import asyncio
+import io
 import logging
-from typing import Optional, Callable, Awaitable
-from datetime import datetime
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncGenerator, Dict, Optional, Callable, Awaitable
+import time
 
 from app.state_machine import StateMachine, TurnState
 from app.stt.deepgram import DeepgramClient
@@ -24,13 +27,76 @@ from app.tts.elevenlabs import ElevenLabsClient
 from app.orchestration.transcript_buffer import TranscriptBuffer
 from app.orchestration.conversation_history import ConversationHistory
 from app.orchestration.silence_timer import SilenceTimer
-from app.utils.audio import AudioBuffer, decode_audio_base64
+from app.orchestration.sentence_queue import SentenceQueue
+from app.orchestration.turn_scope import TurnScope
+from app.utils.audio import AudioBuffer, coalesce_chunks, decode_audio_chunks, mean_abs_amplitude
+from app.utils.cancel import CancelToken
 from app.rag.retriever import RAGRetriever
 from app.rag.vector_store import PineconeVectorStore
-from app.config import settings
+from app.config import frozen as settings
 
 logger = logging.getLogger(__name__)
 
+def _elapsed_ms(start_ns: int, end_ns: int) -> float:
+    """Milliseconds between two time.perf_counter_ns() readings."""
+    return (end_ns - start_ns) / 1_000_000
+
+
+async def _cancel(task: Optional[asyncio.Task], timeout: Optional[float] = None):
+    """
+    Cancel a task and wait until it has finished.
+
+    No-op for None or an already finished task. With a timeout, stops
+    waiting after that many seconds (the task stays cancelled).
+    """
+    if task is None or task.done():
+        return
+    task.cancel()
+    done, _ = await asyncio.wait((task,), timeout=timeout)
+    if not done:
+        logger.warning(f"Task {task.get_name()} still running {timeout}s after cancellation")
+    elif not task.cancelled() and task.exception():
+        logger.warning(f"Task {task.get_name()} failed while cancelling: {task.exception()}")
+
+
+# Per-turn latency spans reported on turn_complete: (name, start mark, end mark)
+_TIMING_SPANS = (
+    ("stt_ms", "speech_end", "llm_start"),
+    ("first_sentence_ms", "speech_end", "first_sentence"),
+    ("llm_ms", "llm_start", "llm_complete"),
+    ("tts_start_ms", "speech_end", "tts_start"),
+    ("tts_first_audio_ms", "tts_start", "first_audio"),
+    ("total_latency_ms", "speech_end", "first_audio"),
+)
+
+# Conversation history messages sent with each prompt (window grows to 2x, see ConversationHistory)
+HISTORY_WINDOW_MESSAGES = 20
+
+# Energy gate for audio outside LISTENING: mean absolute PCM16 amplitude that
+# counts as speech, quiet chunks still forwarded after speech, and quiet
+# chunks held back to lead in the next detected speech
+BARGE_IN_ENERGY_THRESHOLD = 400
+ENERGY_GATE_HANGOVER_CHUNKS = 10
+ENERGY_GATE_PRE_ROLL_CHUNKS = 3
+
+# Partial transcripts outside LISTENING only cancel the response when they
+# look like real speech (not TTS echo or a phantom interim result): minimum
+# STT confidence and word count, and at most one barge-in per debounce window
+BARGE_IN_MIN_CONFIDENCE = 0.6
+BARGE_IN_MIN_WORDS = 2
+BARGE_IN_DEBOUNCE_S = 0.5
+
+# Weight of the newest turn in the cancellation-rate EWMA driving the
+# adaptive silence debounce (~10-turn memory)
+CANCEL_EWMA_ALPHA = 0.1
+
+# States in which a partial transcript can cancel the agent's response
+_BARGE_IN_STATES = frozenset({
+    TurnState.SPECULATIVE,
+    TurnState.COMMITTED,
+    TurnState.SPEAKING,
+})
+
 
 class TurnController:
     """
@@ -56,7 +122,7 @@ class TurnController:
         on_transcript_final: Callable[[str, float], Awaitable[None]],
         on_agent_audio: Callable[[str, int, bool], Awaitable[None]],  # base64, chunk_index, is_final
         on_agent_text_fallback: Callable[[str, str], Awaitable[None]],  # text, reason
-        on_turn_complete: Callable[[str, str, str, int, bool], Awaitable[None]],  # turn_id, user_text, agent_text, duration_ms, was_interrupted
+        on_turn_complete: Callable[[str, str, str, int, bool, Dict[str, int]], Awaitable[None]],  # turn_id, user_text, agent_text, duration_ms, was_interrupted, timings
         on_error: Callable[[str, str, bool], Awaitable[None]],  # code, message, recoverable
     ):
         self.session_id = session_id
@@ -74,9 +140,9 @@ class TurnController:
         self.state_machine = StateMachine()
         self.transcript_buffer = TranscriptBuffer()
         self.audio_buffer = AudioBuffer()
-        self.conversation_history = ConversationHistory()
+        self.conversation_history = ConversationHistory(window_messages=HISTORY_WINDOW_MESSAGES)
 
-        # System prompt for LLM
+        # System prompt for LLM (kept byte-identical across turns for prompt caching)
         self._system_prompt = (
             "You are a helpful voice assistant. Keep responses concise and natural for speech. "
             "Use conversation history for context, but answer only the latest user request. "
@@ -88,15 +154,20 @@ class TurnController:
         self.openai = OpenAIClient()
         self.elevenlabs = ElevenLabsClient()
 
+        # Energy gate state for audio outside LISTENING (see _process_audio)
+        self._gate_quiet_chunks = ENERGY_GATE_HANGOVER_CHUNKS
+        self._gate_pre_roll: deque[bytes] = deque(maxlen=ENERGY_GATE_PRE_ROLL_CHUNKS)
+        self._last_barge_in_ts = 0.0  # time.monotonic() of the last accepted barge-in
+
         # Silence timer
         self.silence_timer = SilenceTimer(
             on_silence_complete=self._on_silence_complete,
             initial_debounce_ms=400,
         )
 
-        # Cancellation control
-        self._llm_cancel_event = asyncio.Event()
-        self._tts_cancel_event = asyncio.Event()
+        # Cancellation control (a fresh token per LLM/TTS run)
+        self._llm_cancel = CancelToken()
+        self._tts_cancel = CancelToken()
 
         # RAG components (initialized lazily)
         self._rag_retriever: Optional[RAGRetriever] = None
@@ -105,56 +176,107 @@ class TurnController:
 
         # Turn tracking
         self._current_turn_id: Optional[str] = None
-        self._turn_start_time: Optional[datetime] = None
         self._llm_response: str = ""
+        self._response_buf = io.StringIO()  # Current LLM run's partial response (new buffer per run)
         self._llm_tokens_used = {"prompt": 0, "completion": 0}
         
-        # Timing measurements (for bottleneck analysis)
-        self._speech_end_time: Optional[datetime] = None
-        self._llm_start_time: Optional[datetime] = None
-        self._llm_complete_time: Optional[datetime] = None
-        self._tts_start_time: Optional[datetime] = None
-        self._first_audio_time: Optional[datetime] = None
+        # Timing marks for the current turn (for bottleneck analysis):
+        # turn_start, speech_end, llm_start, first_sentence, llm_complete,
+        # tts_start, first_audio, speaking_start -> time.perf_counter_ns()
+        self._t: Dict[str, int] = {}
 
         # Playback tracking
         self._waiting_for_playback = False
-        self._playback_timeout_task: Optional[asyncio.Task] = None
+        self._playback_timeout_handle: Optional[asyncio.TimerHandle] = None
+        self._playback_timeout_task: Optional[asyncio.Task] = None  # Completion started by the timeout
         
         # SPEAKING state watchdog
-        self._speaking_start_time: Optional[datetime] = None
         self._speaking_watchdog_task: Optional[asyncio.Task] = None
 
         # Statistics for adaptive behavior
         self._total_turns = 0
         self._cancelled_turns = 0
+        self._tokens_wasted = 0  # Completion tokens of discarded responses
+        self._cancel_ewma = 0.0  # Recent cancellation rate (adaptive debounce input)
+
+        # Telemetry snapshot, updated in place where each metric changes
+        self._telemetry = {
+            "cancellation_rate": 0.0,
+            "cancellation_rate_ewma": 0.0,
+            "avg_debounce_ms": self.silence_timer.get_current_debounce_ms(),
+            "turn_latency_ms": 0,  # TODO: Calculate from turn timing
+            "total_turns": 0,
+            "tokens_wasted": 0,
+            "interruption_count": 0,
+            "rag_enabled": self._rag_enabled,
+            "rag_cache_size": 0,
+        }
         
-        # Sentence queue for LLM→TTS streaming
-        self._sentence_queue: asyncio.Queue[tuple[str, bool]] = asyncio.Queue()  # (sentence, is_final)
+        # Scope of the current response: its LLM/TTS tasks and the
+        # LLM→TTS sentence queue (replaced every turn)
+        self._turn_scope = TurnScope()
         self._tts_task: Optional[asyncio.Task] = None
 
+        # Per-state dispatch for the hot audio/transcript paths (states
+        # without an entry ignore the event)
+        self._audio_handlers: Dict[TurnState, Callable[[bytes], Awaitable[None]]] = {
+            TurnState.LISTENING: self._send_listening_audio,
+            TurnState.SPECULATIVE: self._send_gated_audio,
+            TurnState.COMMITTED: self._send_gated_audio,
+            TurnState.SPEAKING: self._send_gated_audio,
+        }
+        self._partial_handlers: Dict[TurnState, Callable[[str, float], Awaitable[None]]] = {
+            TurnState.LISTENING: self._on_partial_listening,
+            TurnState.SPECULATIVE: self._on_partial_speculative,
+            TurnState.COMMITTED: self._on_partial_committed,
+            TurnState.SPEAKING: self._on_partial_speaking,
+        }
+
         logger.info(f"TurnController initialized for session {session_id}")
 
-    async def start(self):
-        """Initialize external connections."""
-        # Connect to Deepgram
+    async def warm_up(self):
+        """
+        Open every upstream connection before the user starts speaking.
+
+        Connects to Deepgram, pre-warms the pooled OpenAI HTTP connection and
+        pre-opens the ElevenLabs streaming WebSocket concurrently, so the first
+        turn pays no handshakes.
+        """
         self.deepgram = DeepgramClient(
             on_partial_transcript=self._handle_partial_transcript,
             on_final_transcript=self._handle_final_transcript,
             on_error=self._handle_stt_error,
         )
         
-        success = await self.deepgram.connect()
+        success, _, _ = await asyncio.gather(
+            self.deepgram.connect(),
+            self.openai.ping(),
+            self.elevenlabs.connect(),
+        )
         if not success:
             await self.on_error("DEEPGRAM_CONNECTION_FAILED", "Failed to connect to Deepgram", recoverable=True)
+
+    async def start(self):
+        """Initialize external connections (if warm_up() has not already)."""
+        if self.deepgram is None:
+            await self.warm_up()
             
         logger.info("TurnController started")
 
     async def stop(self):
         """Cleanup and disconnect."""
+        # Stop the in-flight response before closing the clients it uses
+        self._llm_cancel.cancel()
+        self._tts_cancel.cancel()
+        self._turn_scope.cancel()
+
         if self.deepgram:
             await self.deepgram.disconnect()
+        await self.elevenlabs.close()
+        self.openai.close()
         
         self.silence_timer.cancel()
+        self._cancel_playback_timeout()
         logger.info("TurnController stopped")
 
     async def handle_audio_chunk(self, audio_base64: str, format: str, sample_rate: int):
@@ -167,49 +289,87 @@ class TurnController:
             sample_rate: Sample rate in Hz
         """
         # Decode audio
-        audio_bytes = decode_audio_base64(audio_base64)
+        audio_bytes = await decode_audio_chunks((audio_base64,))
         if not audio_bytes:
             logger.warning("Failed to decode audio or empty audio received")
             return
         
-        current_state = self.state_machine.current_state
-        logger.debug(f"Received audio: {len(audio_bytes)} bytes, state: {current_state}")
+        await self._process_audio(audio_bytes)
 
-        # Add to buffer only when listening to avoid overflow during SPECULATIVE/SPEAKING
-        if current_state == TurnState.LISTENING:
-            self.audio_buffer.add(audio_bytes)
+    async def handle_audio_batch(self, audio_chunks: list[str]):
+        """
+        Process several consecutive audio chunks from the user at once.
+        
+        The decoded chunks are concatenated and go through state handling and
+        the Deepgram send a single time.
+        
+        Args:
+            audio_chunks: Base64-encoded audio chunks, in arrival order
+        """
+        audio_bytes = await decode_audio_chunks(audio_chunks)
+        if not audio_bytes:
+            logger.warning("Failed to decode audio or empty audio received")
+            return
+        
+        await self._process_audio(audio_bytes)
 
-        # State transitions
-        logger.debug(f"Current state before transition: {current_state}")
+    async def _process_audio(self, audio_bytes: bytes):
+        """
+        Route decoded user audio according to the current state.
         
-        # Log if we have an active Deepgram connection
-        deepgram_connected = self.deepgram is not None and hasattr(self.deepgram, 'is_connected') and self.deepgram.is_connected
-        logger.debug(f"Deepgram connected: {deepgram_connected}")
+        Args:
+            audio_bytes: Raw PCM audio bytes
+        """
+        current_state = self.state_machine.current_state
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "audio %d bytes state=%s deepgram_connected=%s",
+                len(audio_bytes), current_state,
+                self.deepgram is not None and self.deepgram.is_connected,
+            )
+
+        # Audio is forwarded to Deepgram only; nothing reads self.audio_buffer,
+        # so it is not copied there
 
         if current_state == TurnState.IDLE:
             # First audio → start listening
             logger.info("Transitioning from IDLE to LISTENING")
             await self._transition_to_listening()
 
-        elif current_state == TurnState.SPECULATIVE:
-            # Continue sending audio to Deepgram during speculation
-            # Only cancel if NEW SPEECH is detected (handled in transcript callbacks)
-            logger.debug("In SPECULATIVE state - continuing to listen for new speech")
+        if not self.deepgram:
+            return
+
+        handler = self._audio_handlers.get(current_state)
+        if handler is not None:
+            await handler(audio_bytes)
 
-        elif current_state == TurnState.COMMITTED:
-            # Continue sending audio to Deepgram during COMMITTED
-            # User might interrupt before TTS starts speaking
-            logger.debug("In COMMITTED state - monitoring for user interruption")
+    async def _send_listening_audio(self, audio_bytes: bytes):
+        """Forward every chunk to Deepgram while listening (resets the energy gate)."""
+        self._gate_pre_roll.clear()
+        self._gate_quiet_chunks = 0
+        await self.deepgram.send_audio(audio_bytes)
 
-        elif current_state == TurnState.SPEAKING:
-            # Continue sending audio to Deepgram to detect interruptions
-            # Only interrupt if NEW SPEECH is detected (handled in transcript callbacks)
-            logger.debug("In SPEAKING state - monitoring for user interruption")
+    async def _send_gated_audio(self, audio_bytes: bytes):
+        """
+        Forward audio through the energy gate (SPECULATIVE, COMMITTED, SPEAKING).
 
-        # Send audio to Deepgram (in all active states)
-        if self.deepgram and current_state in [TurnState.LISTENING, TurnState.SPECULATIVE, TurnState.COMMITTED, TurnState.SPEAKING]:
-            logger.debug(f"Sending audio to Deepgram in state {current_state}")
+        In these states audio is only needed to detect new speech (an
+        interruption, handled in the transcript callbacks), so silence is
+        not sent.
+        """
+        if mean_abs_amplitude(audio_bytes) >= BARGE_IN_ENERGY_THRESHOLD:
+            # Speech onset: send the held-back lead-in first so the start
+            # of the interruption is not clipped
+            while self._gate_pre_roll:
+                await self.deepgram.send_audio(self._gate_pre_roll.popleft())
+            self._gate_quiet_chunks = 0
+            await self.deepgram.send_audio(audio_bytes)
+        elif self._gate_quiet_chunks < ENERGY_GATE_HANGOVER_CHUNKS:
+            # Keep forwarding briefly after speech so word endings get through
+            self._gate_quiet_chunks += 1
             await self.deepgram.send_audio(audio_bytes)
+        else:
+            self._gate_pre_roll.append(audio_bytes)
 
     async def _handle_partial_transcript(self, text: str, confidence: float):
         """
@@ -221,61 +381,60 @@ class TurnController:
         """
         current_state = self.state_machine.current_state
         
-        # If we're in LISTENING state and get a partial, user is still speaking
-        # → restart silence timer so we don't prematurely fire SPECULATIVE
-        if current_state == TurnState.LISTENING:
-            if self.silence_timer.is_running():
-                logger.debug(f"Partial transcript during LISTENING - restarting silence timer: '{text[:40]}'")
-                self.silence_timer.start()
-        
-        # If we're in SPECULATIVE state and get a NEW partial transcript,
-        # it means user started speaking again → cancel speculation
-        elif current_state == TurnState.SPECULATIVE:
-            logger.info(f"New speech detected during SPECULATIVE: '{text}' - cancelling LLM")
-            await self._cancel_speculation()
-            await self._transition_to_listening()
-        
-        # If we're in COMMITTED state and get a NEW partial transcript,
-        # user is speaking again → cancel TTS task and reset to IDLE
-        elif current_state == TurnState.COMMITTED:
-            logger.info(f"User interrupted during COMMITTED: '{text}' - cancelling TTS task")
-            # Cancel TTS task if running
-            if self._tts_task and not self._tts_task.done():
-                self._tts_cancel_event.set()
-                self._tts_task.cancel()
-                try:
-                    await self._tts_task
-                except asyncio.CancelledError:
-                    pass
-            # Clear sentence queue
-            while not self._sentence_queue.empty():
-                try:
-                    self._sentence_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-            
-            # Transition to IDLE (valid transition), then next audio will go IDLE → LISTENING
-            await self.state_machine.transition(
-                TurnState.IDLE,
-                reason="User interrupted during COMMITTED - resetting"
-            )
-            await self._notify_state_change(TurnState.COMMITTED, TurnState.IDLE)
-            
-            # Unlock transcript buffer so new speech can be captured
-            self.transcript_buffer.unlock()
-            
-            # Start new turn immediately since user is speaking
-            await self._transition_to_listening()
-        
-        # If we're in SPEAKING state and get a NEW partial transcript,
-        # it means user is interrupting (barge-in)
-        elif current_state == TurnState.SPEAKING:
-            logger.info(f"User barge-in detected during SPEAKING: '{text}' - interrupting agent")
-            await self._handle_interrupt()
+        # Ignore partials that don't pass the barge-in gate (echo, noise)
+        if current_state in _BARGE_IN_STATES and not self._passes_barge_in_gate(text, confidence):
+            logger.debug(f"Ignoring partial during {current_state} (confidence {confidence:.2f}): '{text[:40]}'")
+        else:
+            handler = self._partial_handlers.get(current_state)
+            if handler is not None:
+                await handler(text, confidence)
         
         self.transcript_buffer.add_partial(text, confidence)
         await self.on_transcript_partial(text, confidence)
 
+    async def _on_partial_listening(self, text: str, confidence: float):
+        """User is still speaking → restart silence timer so SPECULATIVE doesn't fire early."""
+        if self.silence_timer.is_running():
+            logger.debug(f"Partial transcript during LISTENING - restarting silence timer: '{text[:40]}'")
+            self.silence_timer.start()
+
+    async def _on_partial_speculative(self, text: str, confidence: float):
+        """User started speaking again during SPECULATIVE → cancel speculation."""
+        logger.info(f"New speech detected during SPECULATIVE: '{text}' - cancelling LLM")
+        await self._cancel_speculation()
+        await self._transition_to_listening()
+
+    async def _on_partial_committed(self, text: str, confidence: float):
+        """User is speaking again during COMMITTED → cancel the response and start a new turn."""
+        logger.info(f"User interrupted during COMMITTED: '{text}' - cancelling TTS task")
+        await self._abort_committed_turn("User interrupted during COMMITTED - resetting")
+
+    async def _on_partial_speaking(self, text: str, confidence: float):
+        """User is interrupting the agent (barge-in)."""
+        logger.info(f"User barge-in detected during SPEAKING: '{text}' - interrupting agent")
+        await self._handle_interrupt()
+
+    def _passes_barge_in_gate(self, text: str, confidence: float) -> bool:
+        """
+        Check whether a partial transcript should interrupt the agent.
+
+        Args:
+            text: Partial transcript text
+            confidence: STT confidence score
+
+        Returns:
+            True if the partial is confident, long enough and outside the
+            debounce window of the previous barge-in
+        """
+        if confidence < BARGE_IN_MIN_CONFIDENCE or len(text.split()) < BARGE_IN_MIN_WORDS:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_barge_in_ts < BARGE_IN_DEBOUNCE_S:
+            return False
+        self._last_barge_in_ts = now
+        return True
+
     async def handle_text_input(self, text: str):
         """
         Handle text input directly (for testing without microphone).
@@ -310,33 +469,7 @@ class TurnController:
         if current_state == TurnState.COMMITTED:
             # User is still speaking after silence debounce → cancel TTS and capture new speech
             logger.info(f"User still speaking during COMMITTED: '{text[:50]}' - cancelling TTS")
-            # Cancel TTS task if running
-            if self._tts_task and not self._tts_task.done():
-                self._tts_cancel_event.set()
-                self._tts_task.cancel()
-                try:
-                    await self._tts_task
-                except asyncio.CancelledError:
-                    pass
-            # Clear sentence queue
-            while not self._sentence_queue.empty():
-                try:
-                    self._sentence_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-            
-            # Transition to IDLE (valid transition), then to LISTENING
-            await self.state_machine.transition(
-                TurnState.IDLE,
-                reason="User still speaking - cancelling turn"
-            )
-            await self._notify_state_change(TurnState.COMMITTED, TurnState.IDLE)
-            
-            # Unlock transcript buffer so new speech can be captured
-            self.transcript_buffer.unlock()
-            
-            # Start new turn immediately
-            await self._transition_to_listening()
+            await self._abort_committed_turn("User still speaking - cancelling turn")
             return
 
         # Handle interruption during SPEAKING state
@@ -361,11 +494,7 @@ class TurnController:
             # Cancel previous speculative RAG if still running
             if self._rag_retrieval_task and not self._rag_retrieval_task.done():
                 logger.debug("Cancelling previous speculative RAG (query updated)")
-                self._rag_retrieval_task.cancel()
-                try:
-                    await self._rag_retrieval_task
-                except asyncio.CancelledError:
-                    pass
+                await _cancel(self._rag_retrieval_task)
             
             # Start fresh RAG with accumulated transcript
             full_query = self.transcript_buffer.get_final_text()
@@ -391,8 +520,7 @@ class TurnController:
             return
 
         # Mark speech end time
-        self._speech_end_time = datetime.now()
-        logger.info(f"⏱️ TIMING: User speech ended at {self._speech_end_time.strftime('%H:%M:%S.%f')[:-3]}")
+        self._mark("speech_end")
 
         # RAG already started during debounce (speculative)
         # If not started yet (edge case), start now
@@ -416,10 +544,11 @@ class TurnController:
         # Lock buffer to prevent mutations
         self.transcript_buffer.lock()
 
-        # Start LLM generation (output held until COMMITTED)
-        asyncio.create_task(self._run_llm())
+        # Start LLM generation (output held until COMMITTED) in a fresh scope
+        self._turn_scope = TurnScope()
+        self._turn_scope.create_task(self._run_llm(self._turn_scope))
 
-    async def _run_llm(self):
+    async def _run_llm(self, scope: TurnScope):
         """
         Run LLM generation with sentence-level streaming to TTS.
         
@@ -431,6 +560,9 @@ class TurnController:
         2. On first sentence: SPECULATIVE → COMMITTED → Start TTS task
         3. Queue subsequent sentences for TTS while LLM continues
         4. LLM complete: Signal TTS with is_final=True
+        
+        Args:
+            scope: This response's scope (owns the TTS task and sentence queue)
         """
         user_text = self.transcript_buffer.get_final_text()
         
@@ -440,10 +572,12 @@ class TurnController:
             return
 
         # Track LLM start time
-        self._llm_start_time = datetime.now()
-        if self._speech_end_time:
-            silence_delay = (self._llm_start_time - self._speech_end_time).total_seconds() * 1000
-            logger.info(f"⏱️ TIMING: LLM started {silence_delay:.0f}ms after speech end")
+        self._mark("llm_start")
+
+        # New cancel token for this run, taken before the RAG wait so a
+        # cancellation during it is seen (the scope's sentence queue starts empty)
+        cancel = self._llm_cancel = CancelToken()
+        sentences = scope.sentences
         
         # Wait for RAG retrieval if in progress (should be nearly complete)
         context_docs = []
@@ -461,90 +595,96 @@ class TurnController:
                 logger.warning("⚠️ RAG retrieval timeout - proceeding without context")
             except Exception as e:
                 logger.error(f"❌ RAG retrieval error: {e}")
+
+        # Speculation was cancelled while waiting for RAG
+        if cancel.cancelled or scope.cancelled:
+            logger.info("LLM run cancelled during RAG wait")
+            return
         
         logger.info(f"Starting LLM sentence streaming: {user_text[:50]}...")
 
-        # Clear cancel event and sentence queue
-        self._llm_cancel_event.clear()
-        while not self._sentence_queue.empty():
-            try:
-                self._sentence_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-        # Build messages with RAG context
-        system_prompt = self._build_rag_system_prompt(context_docs)
+        # Build messages: stable prefix (system prompt + history window) first,
+        # per-turn RAG context last so OpenAI's prompt cache keeps hitting
         messages = [
-            {"role": "system", "content": system_prompt},
-            *self.conversation_history.get_messages(),
-            {"role": "user", "content": user_text},
+            {"role": "system", "content": self._system_prompt},
+            *self.conversation_history.get_window(),
         ]
+        context_message = self._build_rag_context_message(context_docs)
+        if context_message:
+            messages.append(context_message)
+        messages.append({"role": "user", "content": user_text})
 
         # Stream sentences from LLM with timeout protection (15s total)
         first_sentence_started = False
-        all_sentences = []
-        completion_tokens = 0
+        # Each run assembles into its own buffer, so a superseded run that is
+        # still streaming can never mix its sentences into this one
+        response_buf = self._response_buf = io.StringIO()
+        self._llm_response = ""
         llm_timeout = 15.0  # Maximum time to wait for LLM response
+        usage: dict = {}  # Filled by this run's stream only
         
         try:
-            # Wrap the async generator iteration with timeout
-            llm_gen = self.openai.stream_sentences(
-                messages=messages,
-                cancel_event=self._llm_cancel_event,
-            )
-            
-            # Use asyncio.wait_for with async for loop workaround
-            start_time = datetime.now()
-            async for sentence, is_final in llm_gen:
-                # Check timeout manually (wait_for doesn't work with async for)
-                elapsed = (datetime.now() - start_time).total_seconds()
-                if elapsed > llm_timeout:
-                    logger.error(f"LLM timeout after {elapsed:.1f}s - aborting")
-                    raise asyncio.TimeoutError("LLM streaming timeout")
-                
-                # Check if cancelled
-                if self._llm_cancel_event.is_set():
-                    logger.info("LLM generation was cancelled")
-                    self._cancelled_turns += 1
-                    # Signal TTS to stop if running
-                    if self._tts_task and not self._tts_task.done():
-                        await self._sentence_queue.put(("", True))  # Empty final to signal stop
-                    return
+            # The timeout scope cancels the stream (closing its HTTP request)
+            # when the deadline passes, wherever it is waiting
+            async with asyncio.timeout(llm_timeout) as llm_deadline, aclosing(
+                self.openai.stream_sentences(
+                    messages=messages,
+                    cancel=cancel,
+                    usage=usage,
+                )
+            ) as llm_gen:
+                async for sentence, is_final in llm_gen:
+                    # Check if cancelled
+                    if cancel.cancelled:
+                        logger.info("LLM generation was cancelled")
+                        self._cancelled_turns += 1
+                        self._update_turn_telemetry()
+                        # Signal TTS to stop if running
+                        if self._tts_task and not self._tts_task.done():
+                            sentences.put_nowait(("", True))  # Empty final to signal stop
+                        return
 
-                all_sentences.append(sentence)
-                completion_tokens += len(sentence.split())  # Rough token estimate
-                
-                # On FIRST sentence: transition to COMMITTED and start TTS
-                if not first_sentence_started:
-                    first_sentence_started = True
+                    # Assemble the full response (space-separated sentences)
+                    if first_sentence_started:
+                        response_buf.write(' ')
+                    response_buf.write(sentence)
                     
-                    # Track first sentence time
-                    first_sentence_time = datetime.now()
-                    if self._speech_end_time:
-                        time_to_first = (first_sentence_time - self._speech_end_time).total_seconds() * 1000
-                        logger.info(f"⏱️ TIMING: First sentence ready {time_to_first:.0f}ms after speech end")
+                    # On FIRST sentence: transition to COMMITTED and start TTS
+                    if not first_sentence_started:
+                        first_sentence_started = True
                     
-                    # Transition SPECULATIVE → COMMITTED
-                    current_state = self.state_machine.current_state
-                    if current_state == TurnState.SPECULATIVE:
-                        await self.state_machine.transition(
-                            TurnState.COMMITTED,
-                            reason="First sentence ready - starting TTS"
-                        )
-                        await self._notify_state_change(TurnState.SPECULATIVE, TurnState.COMMITTED)
-                        logger.info(f"First sentence ready - transitioning to COMMITTED")
+                        # Track first sentence time
+                        self._mark("first_sentence")
                     
-                    # Start TTS consumer task (processes sentences from queue)
-                    self._tts_task = asyncio.create_task(self._run_tts_streaming())
-                
-                # Queue sentence for TTS (TTS task will consume it)
-                await self._sentence_queue.put((sentence, is_final))
-                logger.info(f"📤 Queued sentence for TTS: {sentence[:40]}... (is_final={is_final})")
+                        # Transition SPECULATIVE → COMMITTED
+                        current_state = self.state_machine.current_state
+                        if current_state == TurnState.SPECULATIVE:
+                            await self.state_machine.transition(
+                                TurnState.COMMITTED,
+                                reason="First sentence ready - starting TTS"
+                            )
+                            await self._notify_state_change(TurnState.SPECULATIVE, TurnState.COMMITTED)
+                            logger.info(f"First sentence ready - transitioning to COMMITTED")
+                    
+                        # Start TTS consumer task (processes sentences from queue)
+                        self._tts_task = scope.create_task(self._run_tts_streaming(sentences))
+                    
+                    # Queue sentence for TTS (TTS task will consume it)
+                    sentences.put_nowait((sentence, is_final))
+                    logger.info(f"📤 Queued sentence for TTS: {sentence[:40]}... (is_final={is_final})")
+
+            # stream_sentences ends quietly when cancelled, so check the scope
+            # (turn already torn down) and the deadline
+            if scope.cancelled:
+                logger.info("LLM scope cancelled - response abandoned")
+                return
+            if llm_deadline.expired():
+                raise asyncio.TimeoutError("LLM streaming timeout")
 
             # If no sentences were yielded, check if it was cancelled (expected) or failed (error)
             if not first_sentence_started:
                 # If cancelled, this is expected behavior - don't send error to frontend
-                if self._llm_cancel_event.is_set():
+                if cancel.cancelled:
                     logger.info("LLM cancelled before first sentence - no error")
                     return
                 
@@ -559,19 +699,29 @@ class TurnController:
                 return
 
             # Store full response for conversation history
-            self._llm_response = ' '.join(all_sentences)
-            self._llm_tokens_used = {"prompt": 0, "completion": completion_tokens}
+            self._llm_response = response_buf.getvalue()
+            response_buf.seek(0)
+            response_buf.truncate(0)
+            # Exact counts from the stream's usage chunk; count with the
+            # tokenizer once if the API didn't send one
+            if usage:
+                self._llm_tokens_used = {
+                    "prompt": usage.get("prompt_tokens", 0),
+                    "completion": usage.get("completion_tokens", 0),
+                }
+            else:
+                self._llm_tokens_used = {
+                    "prompt": 0,
+                    "completion": self.openai.estimate_prompt_tokens(self._llm_response),
+                }
             
             # Track LLM completion time
-            self._llm_complete_time = datetime.now()
-            if self._llm_start_time:
-                llm_duration = (self._llm_complete_time - self._llm_start_time).total_seconds() * 1000
-                logger.info(f"⏱️ TIMING: LLM completed in {llm_duration:.0f}ms (all sentences generated)")
+            self._mark("llm_complete")
             
             # ALWAYS signal end of sentences to TTS task
             if self._tts_task and not self._tts_task.done():
                 logger.debug("Sending final signal to TTS queue")
-                await self._sentence_queue.put(("", True))  # Empty final marker
+                sentences.put_nowait(("", True))  # Empty final marker
             
             # Wait for TTS to finish (it handles state transitions)
             if self._tts_task:
@@ -579,10 +729,10 @@ class TurnController:
 
         except asyncio.TimeoutError:
             logger.error("❌ LLM streaming timeout (15s) - API not responding")
-            self._llm_cancel_event.set()
+            cancel.cancel()
             # Cancel TTS if it was started
             if self._tts_task and not self._tts_task.done():
-                self._tts_cancel_event.set()
+                self._tts_cancel.cancel()
                 try:
                     await asyncio.wait_for(self._tts_task, timeout=2.0)
                 except (asyncio.TimeoutError, asyncio.CancelledError):
@@ -598,7 +748,7 @@ class TurnController:
             logger.error(f"❌ Error in LLM sentence streaming: {e}")
             # Cancel TTS if running
             if self._tts_task and not self._tts_task.done():
-                self._tts_cancel_event.set()
+                self._tts_cancel.cancel()
                 try:
                     await asyncio.wait_for(self._tts_task, timeout=2.0)
                 except (asyncio.TimeoutError, asyncio.CancelledError):
@@ -610,7 +760,7 @@ class TurnController:
             )
             await self._reset_to_idle(f"LLM error: {e}")
 
-    async def _run_tts_streaming(self):
+    async def _run_tts_streaming(self, sentences: SentenceQueue):
         """
         Consume sentences from queue and stream TTS audio.
         
@@ -621,64 +771,23 @@ class TurnController:
         self.audio_buffer.clear()
         
         # Track TTS start time
-        self._tts_start_time = datetime.now()
-        if self._speech_end_time:
-            total_delay = (self._tts_start_time - self._speech_end_time).total_seconds() * 1000
-            logger.info(f"⏱️ TIMING: TTS starting {total_delay:.0f}ms after speech end")
+        self._mark("tts_start")
         
-        # Clear cancel event
-        self._tts_cancel_event.clear()
+        # New cancel token for this run
+        self._tts_cancel = CancelToken()
         
         chunk_index = 0
         first_audio_sent = False
-        all_sentences_processed = False
         
         try:
-            while not all_sentences_processed:
-                # Check cancel event before waiting on queue
-                if self._tts_cancel_event.is_set():
-                    logger.info("TTS loop cancelled before queue.get()")
-                    break
-                
-                # Get next sentence from queue (with timeout)
-                try:
-                    sentence, is_final = await asyncio.wait_for(
-                        self._sentence_queue.get(),
-                        timeout=20.0  # Safety timeout - LLM should complete within 15s
-                    )
-                except asyncio.TimeoutError:
-                    logger.error("❌ TTS queue timeout (20s) - LLM likely stalled or failed")
-                    # If stuck in COMMITTED, transition back to IDLE
-                    current_state = self.state_machine.current_state
-                    if current_state == TurnState.COMMITTED:
-                        logger.error("System stuck in COMMITTED - forcing reset to IDLE")
-                        await self.on_error(
-                            "tts_queue_timeout",
-                            "AI audio generation stalled",
-                            recoverable=True
-                        )
-                        await self._reset_to_idle("TTS queue timeout - LLM stalled")
-                    break
-                
-                # Empty sentence with is_final=True signals end
-                if not sentence and is_final:
-                    logger.info("Received end-of-sentences signal")
-                    all_sentences_processed = True
-                    break
-                
-                # Check for cancellation
-                if self._tts_cancel_event.is_set():
-                    logger.info("TTS streaming cancelled")
-                    return
-                
-                # Generate audio for this sentence
-                logger.info(f"🔊 TTS generating audio for: {sentence[:40]}...")
-                
-                async for audio_chunk in self.elevenlabs.generate_audio(
-                    text=sentence,
-                    cancel_event=self._tts_cancel_event,
-                ):
-                    if self._tts_cancel_event.is_set():
+            # One ElevenLabs stream for the whole turn, fed from the sentence
+            # queue; small chunks are merged into fewer, larger frames
+            async with aclosing(self.elevenlabs.stream_sentences(
+                self._queued_sentences(sentences),
+                cancel=self._tts_cancel,
+            )) as audio_stream, aclosing(coalesce_chunks(audio_stream)) as audio_frames:
+                async for audio_chunk in audio_frames:
+                    if self._tts_cancel.cancelled:
                         logger.info("TTS streaming cancelled mid-sentence")
                         return
 
@@ -697,25 +806,23 @@ class TurnController:
                             logger.info("Transitioned to SPEAKING - ElevenLabs TTS streaming")
                             
                             # Start watchdog to detect SPEAKING deadlocks (30s timeout)
-                            self._speaking_start_time = datetime.now()
+                            self._mark("speaking_start")
                             self._speaking_watchdog_task = asyncio.create_task(
                                 self._speaking_state_watchdog(timeout_s=30.0)
                             )
                         
                         # Track total latency
-                        if self._speech_end_time:
-                            self._first_audio_time = datetime.now()
-                            total_latency = (self._first_audio_time - self._speech_end_time).total_seconds() * 1000
-                            logger.info(f"⏱️ TIMING: First audio chunk at {total_latency:.0f}ms (TOTAL LATENCY)")
+                        self._mark("first_audio")
 
                     # Encode and send audio
                     audio_b64 = self.elevenlabs.encode_audio_base64(audio_chunk)
                     await self.on_agent_audio(audio_b64, chunk_index, False)
                     chunk_index += 1
-                
-                # Mark this sentence as done
-                if is_final:
-                    all_sentences_processed = True
+
+            # Cancelled while the stream was winding down
+            if self._tts_cancel.cancelled:
+                logger.info("TTS streaming cancelled")
+                return
 
             # Send final marker
             if chunk_index > 0:
@@ -726,17 +833,14 @@ class TurnController:
             self._waiting_for_playback = True
             
             # Send turn_complete for frontend to display agent text
-            duration_ms = 0
-            if self._turn_start_time:
-                duration_ms = int((datetime.utcnow() - self._turn_start_time).total_seconds() * 1000)
             user_text = self.transcript_buffer.get_final_text()
-            turn_id = f"{self.session_id}_{self._total_turns}"
-            await self.on_turn_complete(turn_id, user_text, self._llm_response, duration_ms, False)
+            turn_id = self._current_turn_id or self._next_turn_id()
+            await self.on_turn_complete(
+                turn_id, user_text, self._llm_response, self._turn_duration_ms(), False, self._timing_deltas()
+            )
             
             # Safety timeout for playback_complete
-            self._playback_timeout_task = asyncio.create_task(
-                self._playback_timeout(timeout_s=15.0)
-            )
+            self._start_playback_timeout(timeout_s=15.0)
 
         except asyncio.CancelledError:
             logger.info("TTS streaming cancelled by user interruption")
@@ -755,6 +859,64 @@ class TurnController:
                 await self.on_agent_text_fallback(self._llm_response, str(e))
             await self._complete_turn(was_interrupted=False)
 
+    async def _queued_sentences(self, sentences: SentenceQueue) -> AsyncGenerator[str, None]:
+        """
+        Yield sentences from the LLM→TTS queue until the turn's text ends.
+        
+        Ends on the final sentence, the empty end-of-sentences marker,
+        cancellation, or the 20s safety timeout (which resets a stuck turn).
+        
+        One timeout scope serves the whole loop: its deadline is armed only
+        while waiting on an empty queue and disarmed before each yield, so
+        sentences that are already queued cost no timer at all.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(None) as queue_deadline:
+                while True:
+                    # Check cancel event before waiting on queue
+                    if self._tts_cancel.cancelled:
+                        logger.info("TTS loop cancelled before queue.get()")
+                        return
+                    
+                    # Get next sentence from queue (safety timeout - LLM should complete within 15s)
+                    if sentences.empty():
+                        queue_deadline.reschedule(loop.time() + 20.0)
+                        sentence, is_final = await sentences.get()
+                        queue_deadline.reschedule(None)
+                    else:
+                        sentence, is_final = await sentences.get()
+                    
+                    # Empty sentence with is_final=True signals end
+                    if not sentence and is_final:
+                        logger.info("Received end-of-sentences signal")
+                        return
+                    
+                    # Check for cancellation
+                    if self._tts_cancel.cancelled:
+                        logger.info("TTS streaming cancelled")
+                        return
+                    
+                    logger.info(f"🔊 TTS generating audio for: {sentence[:40]}...")
+                    yield sentence
+                    
+                    # Mark this sentence as done
+                    if is_final:
+                        return
+        
+        except TimeoutError:
+            logger.error("❌ TTS queue timeout (20s) - LLM likely stalled or failed")
+            # If stuck in COMMITTED, transition back to IDLE
+            current_state = self.state_machine.current_state
+            if current_state == TurnState.COMMITTED:
+                logger.error("System stuck in COMMITTED - forcing reset to IDLE")
+                await self.on_error(
+                    "tts_queue_timeout",
+                    "AI audio generation stalled",
+                    recoverable=True
+                )
+                await self._reset_to_idle("TTS queue timeout - LLM stalled")
+
     async def _run_tts(self):
         """
         DEPRECATED: Legacy non-streaming TTS.
@@ -771,10 +933,7 @@ class TurnController:
         self.audio_buffer.clear()
         
         # Track TTS start time
-        self._tts_start_time = datetime.now()
-        if self._speech_end_time:
-            total_delay = (self._tts_start_time - self._speech_end_time).total_seconds() * 1000
-            logger.info(f"⏱️ TIMING: TTS starting {total_delay:.0f}ms after speech end")
+        self._mark("tts_start")
         
         # Transition to SPEAKING exactly when TTS starts streaming
         await self.state_machine.transition(
@@ -784,25 +943,23 @@ class TurnController:
         await self._notify_state_change(TurnState.COMMITTED, TurnState.SPEAKING)
         logger.info("Transitioned to SPEAKING - ElevenLabs TTS streaming")
 
-        # Clear cancel event
-        self._tts_cancel_event.clear()
+        # New cancel token for this run
+        self._tts_cancel = CancelToken()
 
         # Stream TTS audio
         chunk_index = 0
         try:
             async for audio_chunk in self.elevenlabs.generate_audio(
                 text=self._llm_response,
-                cancel_event=self._tts_cancel_event,
+                cancel=self._tts_cancel,
             ):
-                if self._tts_cancel_event.is_set():
+                if self._tts_cancel.cancelled:
                     logger.info("TTS streaming cancelled")
                     return
 
                 # Track first audio chunk (total latency)
-                if chunk_index == 0 and self._speech_end_time:
-                    self._first_audio_time = datetime.now()
-                    total_latency = (self._first_audio_time - self._speech_end_time).total_seconds() * 1000
-                    logger.info(f"⏱️ TIMING: First audio chunk at {total_latency:.0f}ms (TOTAL LATENCY)")
+                if chunk_index == 0:
+                    self._mark("first_audio")
 
                 # Encode and send
                 audio_b64 = self.elevenlabs.encode_audio_base64(audio_chunk)
@@ -821,17 +978,14 @@ class TurnController:
             
             # Send turn_complete now so frontend can display agent text immediately
             # But do NOT transition state yet - stay in SPEAKING
-            duration_ms = 0
-            if self._turn_start_time:
-                duration_ms = int((datetime.utcnow() - self._turn_start_time).total_seconds() * 1000)
             user_text = self.transcript_buffer.get_final_text()
-            turn_id = f"{self.session_id}_{self._total_turns}"
-            await self.on_turn_complete(turn_id, user_text, self._llm_response, duration_ms, False)
+            turn_id = self._current_turn_id or self._next_turn_id()
+            await self.on_turn_complete(
+                turn_id, user_text, self._llm_response, self._turn_duration_ms(), False, self._timing_deltas()
+            )
             
             # Safety timeout: if playback_complete doesn't arrive within 15s, auto-complete
-            self._playback_timeout_task = asyncio.create_task(
-                self._playback_timeout(timeout_s=15.0)
-            )
+            self._start_playback_timeout(timeout_s=15.0)
 
         except Exception as e:
             logger.error(f"TTS error: {e}")
@@ -839,6 +993,41 @@ class TurnController:
             await self.on_agent_text_fallback(self._llm_response, str(e))
             await self._complete_turn(was_interrupted=False)
 
+    def _mark(self, name: str):
+        """
+        Record a timing mark for the current turn.
+
+        Args:
+            name: Mark name (e.g. "speech_end", "first_audio")
+        """
+        now = time.perf_counter_ns()
+        self._t[name] = now
+        if logger.isEnabledFor(logging.DEBUG):
+            speech_end = self._t.get("speech_end")
+            if speech_end is not None:
+                logger.debug("⏱️ TIMING: %s at +%.0fms after speech end", name, _elapsed_ms(speech_end, now))
+
+    def _timing_deltas(self) -> Dict[str, int]:
+        """Get the current turn's latency spans (ms) whose marks are both recorded."""
+        t = self._t
+        return {
+            name: (t[end] - t[start]) // 1_000_000
+            for name, start, end in _TIMING_SPANS
+            if start in t and end in t
+        }
+
+    def _next_turn_id(self) -> str:
+        """Assign the ID of the turn that is starting."""
+        self._current_turn_id = f"{self.session_id}_{self._total_turns}"
+        return self._current_turn_id
+
+    def _turn_duration_ms(self) -> int:
+        """Get milliseconds since the current turn started (0 if not tracking)."""
+        turn_start = self._t.get("turn_start")
+        if turn_start is None:
+            return 0
+        return int(_elapsed_ms(turn_start, time.perf_counter_ns()))
+
     async def _complete_turn(self, was_interrupted: bool, notify: bool = True):
         """
         Complete the current turn and reset to IDLE.
@@ -848,24 +1037,13 @@ class TurnController:
             notify: Whether to send turn_complete message (False if already sent)
         """
         # Calculate duration
-        duration_ms = 0
-        if self._turn_start_time:
-            duration_ms = int((datetime.utcnow() - self._turn_start_time).total_seconds() * 1000)
-
-        # Log timing summary
-        if self._speech_end_time and self._llm_start_time and self._llm_complete_time and self._tts_start_time and self._first_audio_time:
-            silence_to_llm = (self._llm_start_time - self._speech_end_time).total_seconds() * 1000
-            llm_duration = (self._llm_complete_time - self._llm_start_time).total_seconds() * 1000
-            llm_to_tts = (self._tts_start_time - self._llm_complete_time).total_seconds() * 1000
-            tts_to_audio = (self._first_audio_time - self._tts_start_time).total_seconds() * 1000
-            total_latency = (self._first_audio_time - self._speech_end_time).total_seconds() * 1000
-            
-            logger.info(f"⏱️ TIMING SUMMARY:")
-            logger.info(f"  Speech → LLM Start: {silence_to_llm:.0f}ms")
-            logger.info(f"  LLM Generation: {llm_duration:.0f}ms ({self._llm_tokens_used.get('completion', 0)} tokens)")
-            logger.info(f"  LLM → TTS Start: {llm_to_tts:.0f}ms")
-            logger.info(f"  TTS → First Audio: {tts_to_audio:.0f}ms")
-            logger.info(f"  TOTAL LATENCY: {total_latency:.0f}ms")
+        duration_ms = self._turn_duration_ms()
+
+        # Log timing summary (one structured record per turn); the deltas
+        # are computed regardless since turn_complete carries them
+        timings = self._timing_deltas()
+        if timings and logger.isEnabledFor(logging.INFO):
+            logger.info("turn timings: %s", timings)
 
         # Get transcripts
         user_text = self.transcript_buffer.get_final_text()
@@ -875,19 +1053,17 @@ class TurnController:
         if user_text or agent_text:
             self.conversation_history.add_turn(user_text, agent_text)
 
-        # Generate turn ID
-        turn_id = f"{self.session_id}_{self._total_turns}"
+        # Turn ID assigned at turn start (same one sent after TTS streaming)
+        turn_id = self._current_turn_id or self._next_turn_id()
         self._total_turns += 1
 
         # Notify completion (skip if already sent, e.g. after TTS streaming)
         if notify:
-            await self.on_turn_complete(turn_id, user_text, agent_text, duration_ms, was_interrupted)
+            await self.on_turn_complete(turn_id, user_text, agent_text, duration_ms, was_interrupted, timings)
 
         # Clear playback wait state
         self._waiting_for_playback = False
-        if self._playback_timeout_task and not self._playback_timeout_task.done():
-            self._playback_timeout_task.cancel()
-            self._playback_timeout_task = None
+        self._cancel_playback_timeout()
         
         # Cancel SPEAKING watchdog
         if self._speaking_watchdog_task and not self._speaking_watchdog_task.done():
@@ -897,46 +1073,36 @@ class TurnController:
         # Reset state
         await self._reset_to_idle("Turn complete")
 
-        # Adjust silence debounce
-        if self._total_turns > 0:
-            cancellation_rate = self._cancelled_turns / self._total_turns
-            self.silence_timer.adjust_debounce(cancellation_rate)
+        # Adjust silence debounce from the recent (not all-time) cancellation rate
+        self._update_cancel_ewma(cancelled=False)
+        self.silence_timer.adjust_debounce(self._cancel_ewma)
+        self._telemetry["avg_debounce_ms"] = self.silence_timer.get_current_debounce_ms()
+        self._update_turn_telemetry()
 
     async def _handle_interrupt(self):
         """
         Handle user interruption during agent speaking (barge-in).
         
-        Cancels TTS and transitions SPEAKING → LISTENING.
+        Cancels the response (LLM and TTS) and transitions SPEAKING → LISTENING.
         """
         logger.info("User interrupted agent")
 
-        # Cancel TTS
-        self._tts_cancel_event.set()
-        
-        # Cancel TTS task if running (with timeout to prevent deadlock)
-        if self._tts_task and not self._tts_task.done():
-            self._tts_task.cancel()
-            try:
-                await asyncio.wait_for(self._tts_task, timeout=1.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                logger.warning("TTS task cancellation timed out - forcing completion")
-                pass
-        
-        # Clear sentence queue
-        while not self._sentence_queue.empty():
-            try:
-                self._sentence_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-        
-        # Force Deepgram to finalize any pending transcripts
-        await self.deepgram.finish_utterance()
+        # Cancel the whole response: the LLM is often still streaming when
+        # SPEAKING starts, and must not outlive the turn it belongs to
+        self._llm_cancel.cancel()
+        self._tts_cancel.cancel()
+        self._turn_scope.cancel()
+        
+        # Wait for the TTS task to stop (with timeout to prevent deadlock) while
+        # forcing Deepgram to finalize any pending transcripts
+        await asyncio.gather(
+            _cancel(self._tts_task, timeout=1.0),
+            self.deepgram.finish_utterance(),
+        )
         
         # Cancel playback wait if active
         self._waiting_for_playback = False
-        if self._playback_timeout_task and not self._playback_timeout_task.done():
-            self._playback_timeout_task.cancel()
-            self._playback_timeout_task = None
+        self._cancel_playback_timeout()
 
         # Transition to LISTENING
         await self.state_machine.transition(
@@ -962,28 +1128,41 @@ class TurnController:
         self._waiting_for_playback = False
         
         # Cancel timeout
-        if self._playback_timeout_task and not self._playback_timeout_task.done():
-            self._playback_timeout_task.cancel()
-            self._playback_timeout_task = None
+        self._cancel_playback_timeout()
         
         # Don't send turn_complete again - already sent after TTS streaming
         await self._complete_turn(was_interrupted=False, notify=False)
 
-    async def _playback_timeout(self, timeout_s: float = 15.0):
+    def _start_playback_timeout(self, timeout_s: float = 15.0):
         """
-        Safety timeout: auto-complete turn if playback_complete never arrives.
+        Arm the safety timeout: auto-complete turn if playback_complete never arrives.
+        
+        A loop timer rather than a sleeping task, so disarming it is a
+        synchronous flag flip.
         
         Args:
             timeout_s: Seconds to wait before auto-completing
         """
-        try:
-            await asyncio.sleep(timeout_s)
-            if self._waiting_for_playback:
-                logger.warning(f"Playback timeout after {timeout_s}s - auto-completing turn")
-                self._waiting_for_playback = False
-                await self._complete_turn(was_interrupted=False, notify=False)
-        except asyncio.CancelledError:
-            pass  # Normal cancellation when playback_complete arrives
+        self._cancel_playback_timeout()
+        self._playback_timeout_handle = asyncio.get_running_loop().call_later(
+            timeout_s, self._on_playback_timeout, timeout_s
+        )
+
+    def _cancel_playback_timeout(self):
+        """Disarm the playback safety timeout (no-op if not armed)."""
+        if self._playback_timeout_handle:
+            self._playback_timeout_handle.cancel()
+            self._playback_timeout_handle = None
+
+    def _on_playback_timeout(self, timeout_s: float):
+        """Timer callback: complete the turn if playback is still pending."""
+        self._playback_timeout_handle = None
+        if self._waiting_for_playback:
+            logger.warning(f"Playback timeout after {timeout_s}s - auto-completing turn")
+            self._waiting_for_playback = False
+            self._playback_timeout_task = asyncio.create_task(
+                self._complete_turn(was_interrupted=False, notify=False)
+            )
 
     async def _speaking_state_watchdog(self, timeout_s: float = 30.0):
         """
@@ -1005,17 +1184,11 @@ class TurnController:
                 logger.error(f"❌ SPEAKING state watchdog triggered after {timeout_s}s - TTS/playback stalled")
                 
                 # Cancel all TTS operations
-                self._tts_cancel_event.set()
-                if self._tts_task and not self._tts_task.done():
-                    self._tts_task.cancel()
-                    try:
-                        await self._tts_task
-                    except asyncio.CancelledError:
-                        pass
+                self._tts_cancel.cancel()
+                await _cancel(self._tts_task)
                 
                 # Cancel playback timeout
-                if self._playback_timeout_task and not self._playback_timeout_task.done():
-                    self._playback_timeout_task.cancel()
+                self._cancel_playback_timeout()
                 
                 # Notify frontend of error
                 await self.on_error(
@@ -1030,6 +1203,33 @@ class TurnController:
         except asyncio.CancelledError:
             pass  # Normal cancellation when SPEAKING completes
 
+    async def _abort_committed_turn(self, reason: str):
+        """
+        Abandon a committed response because the user is still speaking.
+
+        The response's LLM and TTS tasks are cancelled together through its
+        scope (no awaits in between), then COMMITTED → IDLE → LISTENING so the
+        new speech starts a fresh turn.
+
+        Args:
+            reason: Reason for the IDLE transition
+        """
+        self._llm_cancel.cancel()
+        self._tts_cancel.cancel()
+        self._turn_scope.cancel()
+        self._record_wasted_tokens()
+        self._update_cancel_ewma(cancelled=True)
+
+        # Transition to IDLE (valid transition), then to LISTENING
+        await self.state_machine.transition(TurnState.IDLE, reason=reason)
+        await self._notify_state_change(TurnState.COMMITTED, TurnState.IDLE)
+
+        # Unlock transcript buffer so new speech can be captured
+        self.transcript_buffer.unlock()
+
+        # Start new turn immediately since user is speaking
+        await self._transition_to_listening()
+
     async def _cancel_speculation(self):
         """
         Cancel speculative LLM execution.
@@ -1039,23 +1239,15 @@ class TurnController:
         logger.info("Cancelling speculation")
 
         # Cancel LLM
-        self._llm_cancel_event.set()
+        self._llm_cancel.cancel()
+        self._record_wasted_tokens()
         
         # Cancel TTS if running
-        self._tts_cancel_event.set()
-        if self._tts_task and not self._tts_task.done():
-            self._tts_task.cancel()
-            try:
-                await self._tts_task
-            except asyncio.CancelledError:
-                pass
+        self._tts_cancel.cancel()
+        await _cancel(self._tts_task)
         
-        # Clear sentence queue
-        while not self._sentence_queue.empty():
-            try:
-                self._sentence_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Cancel the LLM run and clear its sentence queue
+        self._turn_scope.cancel()
 
         # Cancel silence timer
         self.silence_timer.cancel()
@@ -1065,6 +1257,37 @@ class TurnController:
 
         # Track cancellation
         self._cancelled_turns += 1
+        self._update_turn_telemetry()
+        self._update_cancel_ewma(cancelled=True)
+
+    def _update_cancel_ewma(self, cancelled: bool):
+        """
+        Fold one turn outcome into the cancellation-rate EWMA.
+
+        Args:
+            cancelled: True if the response was cancelled because the user kept speaking
+        """
+        self._cancel_ewma += CANCEL_EWMA_ALPHA * (float(cancelled) - self._cancel_ewma)
+        self._telemetry["cancellation_rate_ewma"] = self._cancel_ewma
+
+    def _record_wasted_tokens(self):
+        """
+        Add the discarded response's completion tokens to tokens_wasted.
+
+        Uses the exact count if the LLM already finished, otherwise counts the
+        sentences streamed so far. The response is cleared so it is only
+        counted once.
+        """
+        if self._llm_response:
+            self._tokens_wasted += self._llm_tokens_used["completion"]
+            self._llm_response = ""
+        else:
+            partial = self._response_buf.getvalue()
+            if partial:
+                self._tokens_wasted += self.openai.estimate_prompt_tokens(partial)
+                self._response_buf.seek(0)
+                self._response_buf.truncate(0)
+        self._telemetry["tokens_wasted"] = self._tokens_wasted
 
     async def _transition_to_listening(self):
         """Transition to LISTENING state and start turn tracking."""
@@ -1072,9 +1295,7 @@ class TurnController:
         logger.info(f"_transition_to_listening called, current state: {current}")
         
         # Cancel old playback watchdog from previous turn
-        if self._playback_timeout_task and not self._playback_timeout_task.done():
-            self._playback_timeout_task.cancel()
-            self._playback_timeout_task = None
+        self._cancel_playback_timeout()
         
         if current != TurnState.LISTENING:
             logger.info(f"Attempting transition from {current} to LISTENING")
@@ -1086,8 +1307,9 @@ class TurnController:
             await self._notify_state_change(current, TurnState.LISTENING)
             
             # Start turn tracking
-            if self._turn_start_time is None:
-                self._turn_start_time = datetime.utcnow()
+            if "turn_start" not in self._t:
+                self._t = {"turn_start": time.perf_counter_ns()}
+                self._next_turn_id()
                 logger.info("Started turn tracking")
 
     async def _reset_to_idle(self, reason: str):
@@ -1100,9 +1322,7 @@ class TurnController:
         current = self.state_machine.current_state
         
         # Cancel playback watchdog
-        if self._playback_timeout_task and not self._playback_timeout_task.done():
-            self._playback_timeout_task.cancel()
-            self._playback_timeout_task = None
+        self._cancel_playback_timeout()
         
         if current != TurnState.IDLE:
             await self.state_machine.transition(TurnState.IDLE, reason=reason)
@@ -1114,7 +1334,8 @@ class TurnController:
         
         # Reset turn state
         self._llm_response = ""
-        self._turn_start_time = None
+        self._t = {}
+        self._current_turn_id = None
         
         # Cancel and reset RAG retrieval task
         if self._rag_retrieval_task and not self._rag_retrieval_task.done():
@@ -1156,25 +1377,24 @@ class TurnController:
         """
         Get current telemetry metrics.
         
+        The metrics are updated in place where they change, so this is a
+        plain copy of the snapshot.
+        
         Returns:
             Dict with metrics for monitoring
         """
-        cancellation_rate = (
+        return self._telemetry.copy()
+
+    def _update_turn_telemetry(self):
+        """Refresh the turn-count metrics in the telemetry snapshot."""
+        telemetry = self._telemetry
+        telemetry["total_turns"] = self._total_turns
+        telemetry["interruption_count"] = self._cancelled_turns
+        telemetry["cancellation_rate"] = (
             self._cancelled_turns / self._total_turns
             if self._total_turns > 0
             else 0.0
         )
-
-        return {
-            "cancellation_rate": cancellation_rate,
-            "avg_debounce_ms": self.silence_timer.get_current_debounce_ms(),
-            "turn_latency_ms": 0,  # TODO: Calculate from turn timing
-            "total_turns": self._total_turns,
-            "tokens_wasted": self._llm_tokens_used["completion"] if self._llm_cancel_event.is_set() else 0,
-            "interruption_count": self._cancelled_turns,
-            "rag_enabled": self._rag_enabled,
-            "rag_cache_size": self._rag_retriever.cache_size if self._rag_retriever else 0,
-        }
     
     def enable_rag(
         self, 
@@ -1201,12 +1421,14 @@ class TurnController:
             min_similarity=settings.rag_min_similarity
         )
         self._rag_enabled = True
+        self._telemetry["rag_enabled"] = True
         embedding_source = "local" if use_local and local_embedder else "OpenAI API"
         logger.info(f"RAG retrieval enabled (embedding: {embedding_source})")
     
     def disable_rag(self):
         """Disable RAG retrieval."""
         self._rag_enabled = False
+        self._telemetry["rag_enabled"] = False
         logger.info("RAG retrieval disabled")
     
     async def _retrieve_with_timeout(self, query: str) -> list:
@@ -1228,41 +1450,41 @@ class TurnController:
                 session_id=self.session_id,
                 timeout_ms=settings.rag_timeout_ms
             )
+            self._telemetry["rag_cache_size"] = self._rag_retriever.cache_size
             return results
         except Exception as e:
             logger.error(f"RAG retrieval failed: {e}")
             return []
     
-    def _build_rag_system_prompt(self, context_docs: list) -> str:
+    def _build_rag_context_message(self, context_docs: list) -> Optional[dict]:
         """
-        Build system prompt with RAG context.
+        Build the message carrying RAG context for this turn.
+        
+        Sent as its own message after the history (not spliced into the system
+        prompt) so the cached prompt prefix stays identical across turns.
         
         Args:
             context_docs: Retrieved document chunks
             
         Returns:
-            System prompt with or without context
+            System message with context, or None if no context was found
         """
-        base_prompt = (
-            "You are a helpful voice assistant. Keep responses concise and natural for speech. "
-            "Use conversation history for context, but answer only the latest user request. "
-            "Do NOT repeat or restate previous assistant replies."
-        )
-        
         if not context_docs:
-            # No context found - return base prompt
-            return base_prompt
+            return None
+        
+        # Deterministic order so identical retrievals produce identical text
+        ordered_docs = sorted(
+            context_docs,
+            key=lambda doc: (doc.get('filename', ''), doc.get('chunk_id', 0)),
+        )
         
         # Build context section
-        context_text = "\\n\\n".join([
-            f"[Source: {doc.get('filename', 'unknown')} - Relevance: {doc.get('score', 0):.2f}]\\n{doc.get('text', '')}"
-            for doc in context_docs
+        context_text = "\n\n".join([
+            f"[Source: {doc.get('filename', 'unknown')} - Relevance: {doc.get('score', 0):.2f}]\n{doc.get('text', '')}"
+            for doc in ordered_docs
         ])
         
-        # Augmented prompt with context
-        augmented_prompt = f"""{base_prompt}
-
-You have access to the following relevant information from the user's knowledge base:
+        content = f"""You have access to the following relevant information from the user's knowledge base:
 
 {context_text}
 
@@ -1274,4 +1496,4 @@ Instructions for using this information:
 - Keep responses concise for voice delivery (2-3 sentences max)
 """
         
-        return augmented_prompt
+        return {"role": "system", "content": content}
@@ -0,0 +1,72 @@
+"""
+Cancellation scope for one agent response.
+
+Owns the tasks (LLM, TTS) and the sentence queue of a single turn so a
+barge-in can tear the whole response down in one synchronous call, with no
+await points for incoming audio callbacks to race against.
+"""
+
+import asyncio
+from typing import Coroutine, Set
+
+from app.orchestration.sentence_queue import SentenceQueue
+
+
+class TurnScope:
+    """
+    Group of tasks and the LLM→TTS queue belonging to one response.
+
+    Key Features:
+    - create_task() registers a task with the scope
+    - cancel() cancels every registered task and drains the queue at once
+    - A cancelled scope is discarded: the next turn gets a fresh scope (and
+      queue), so a sentence produced late by a cancelled task can never
+      reach the next turn's TTS
+    """
+
+    __slots__ = ("sentences", "_tasks", "_cancelled")
+
+    def __init__(self):
+        self.sentences = SentenceQueue()
+        self._tasks: Set[asyncio.Task] = set()
+        self._cancelled = False
+
+    def create_task(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Schedule a coroutine as part of this scope.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro)
+        if self._cancelled:
+            task.cancel()
+            return task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel(self):
+        """
+        Cancel every task in the scope and discard queued sentences.
+
+        Never cancels the calling task, so a task may cancel its own scope.
+        """
+        self._cancelled = True
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        self.sentences.drain()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if the scope has been cancelled."""
+        return self._cancelled
+
+    def __len__(self) -> int:
+        """Number of tasks still running in the scope."""
+        return len(self._tasks)
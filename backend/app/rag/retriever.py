@@ -8,6 +8,7 @@ from .vector_store import PineconeVectorStore
 from .local_embedder import LocalEmbedder
 import logging
 import asyncio
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -69,8 +70,7 @@ class RAGRetriever:
             List of relevant chunks with text, score, source info
             Returns empty list on timeout or error
         """
-        from datetime import datetime
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         logger.info(f"🔍 RAG retrieve starting: query='{query[:50]}', session={session_id[:8]}, timeout={timeout_ms}ms")
         
         try:
@@ -79,12 +79,12 @@ class RAGRetriever:
                 self._retrieve_internal(query, session_id),
                 timeout=timeout_ms / 1000
             )
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
+            elapsed = (time.perf_counter_ns() - start_time) // 1_000_000
             logger.info(f"✅ RAG retrieve completed in {elapsed:.0f}ms with {len(result)} results")
             return result
             
         except asyncio.TimeoutError:
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
+            elapsed = (time.perf_counter_ns() - start_time) // 1_000_000
             logger.warning(
                 f"RAG retrieval timeout after {timeout_ms}ms (actual: {elapsed:.0f}ms) for query: {query[:50]}"
             )
@@ -100,14 +100,13 @@ class RAGRetriever:
         session_id: str
     ) -> List[Dict]:
         """Internal retrieval without timeout wrapper."""
-        from datetime import datetime
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         logger.info(f"📝 _retrieve_internal STARTED: query='{query}' (len={len(query)}), session={session_id[:8]}")
         
         # Step 1: Generate query embedding (with caching)
         logger.info("🔄 Step 1: Generating query embedding...")
         query_embedding = await self._get_query_embedding(query)
-        embedding_time = (datetime.now() - start_time).total_seconds() * 1000
+        embedding_time = (time.perf_counter_ns() - start_time) // 1_000_000
         logger.info(f"✅ Embedding generated in {embedding_time:.0f}ms")
         
         if not query_embedding:
@@ -116,15 +115,15 @@ class RAGRetriever:
         
         # Step 2: Search vector database
         logger.info(f"🔍 Step 2: Searching Pinecone (top_k={self.top_k}, min_sim={self.min_similarity})...")
-        search_start = datetime.now()
+        search_start = time.perf_counter_ns()
         results = await self.vector_store.search(
             query_embedding=query_embedding,
             session_id=session_id,
             top_k=self.top_k,
             min_score=self.min_similarity
         )
-        search_time = (datetime.now() - search_start).total_seconds() * 1000
-        total_time = (datetime.now() - start_time).total_seconds() * 1000
+        search_time = (time.perf_counter_ns() - search_start) // 1_000_000
+        total_time = (time.perf_counter_ns() - start_time) // 1_000_000
         
         logger.info(
             f"📊 RAG complete - Embedding: {embedding_time:.0f}ms, Search: {search_time:.0f}ms, "
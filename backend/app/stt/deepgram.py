@@ -6,9 +6,11 @@ with exponential backoff retry logic (5 attempts: 0s, 1s, 2s, 4s, 8s).
 """
 
 import asyncio
-import json
 import logging
 from typing import Callable, Optional, Awaitable
+from urllib.parse import urlencode
+
+import orjson
 from websockets import connect, WebSocketClientProtocol
 from websockets.exceptions import WebSocketException
 
@@ -16,6 +18,41 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Deepgram nova-3 streaming configuration with multilingual support
+# nova-3 supports: Indian English (en-IN), Hindi (hi), and 10+ other languages
+_STREAMING_PARAMS = {
+    "model": "nova-3",
+    "language": "multi",  # Enables multilingual mode (English + Hindi code-switching)
+    "encoding": "linear16",
+    "sample_rate": 16000,
+    "channels": 1,
+    "interim_results": "true",
+    "punctuate": "true",
+    "smart_format": "true",  # Better number/date formatting
+    "utterance_end_ms": 1000,
+    "vad_events": "true",
+    "diarize": "false",  # Single speaker assumed
+}
+# Built once; every (re)connect reuses it
+_DEEPGRAM_URL = "wss://api.deepgram.com/v1/listen?" + urlencode(_STREAMING_PARAMS)
+
+# Most queued audio chunks merged into one WebSocket frame
+_MAX_COALESCED_CHUNKS = 8
+
+# KeepAlive is sent after this many seconds without outgoing audio
+_KEEPALIVE_INTERVAL_S = 5.0
+
+# Control frames, serialized once
+_CLOSE_FRAME = orjson.dumps({"type": "CloseStream"}).decode()
+_KEEPALIVE_FRAME = orjson.dumps({"type": "KeepAlive"}).decode()
+_FINISH_UTTERANCE_FRAME = orjson.dumps({"type": "FinishUtterance"}).decode()
+
+# Substrings probed before parsing: only transcripts and errors are handled,
+# and silence produces a steady stream of empty transcripts
+_TRANSCRIPT_KEY = '"transcript"'
+_EMPTY_TRANSCRIPT = '"transcript":""'
+_ERROR_KEY = '"error"'
+
 
 class DeepgramClient:
     """
@@ -43,6 +80,7 @@ class DeepgramClient:
             on_error: Optional callback for error handling
         """
         self.api_key = settings.deepgram_api_key
+        self._auth_headers = {"Authorization": f"Token {self.api_key}"}
         self.on_partial_transcript = on_partial_transcript
         self.on_final_transcript = on_final_transcript
         self.on_error = on_error
@@ -52,6 +90,8 @@ class DeepgramClient:
         self.is_closing = False
         self._receive_task: Optional[asyncio.Task] = None
         self._send_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._last_send_time = 0.0  # loop.time() of the last frame sent
         self._audio_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 5
@@ -67,30 +107,18 @@ class DeepgramClient:
             logger.warning("Already connected to Deepgram")
             return True
 
-        # Deepgram nova-3 streaming configuration with multilingual support
-        # nova-3 supports: Indian English (en-IN), Hindi (hi), and 10+ other languages
-        params = {
-            "model": "nova-3",
-            "language": "multi",  # Enables multilingual mode (English + Hindi code-switching)
-            "encoding": "linear16",
-            "sample_rate": 16000,
-            "channels": 1,
-            "interim_results": "true",
-            "punctuate": "true",
-            "smart_format": "true",  # Better number/date formatting
-            "utterance_end_ms": 1000,
-            "vad_events": "true",
-            "diarize": "false",  # Single speaker assumed
-        }
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        url = f"wss://api.deepgram.com/v1/listen?{query_string}"
-
         try:
             self.ws = await connect(
-                url,
-                extra_headers={"Authorization": f"Token {self.api_key}"},
+                _DEEPGRAM_URL,
+                extra_headers=self._auth_headers,
                 ping_interval=10,
                 ping_timeout=5,
+                # PCM audio is incompressible: skip permessage-deflate
+                compression=None,
+                # Bound buffered incoming messages; larger write buffer
+                # before send() waits for drain
+                max_queue=32,
+                write_limit=2**18,
             )
             self.is_connected = True
             self._reconnect_attempts = 0
@@ -100,6 +128,11 @@ class DeepgramClient:
             self._receive_task = asyncio.create_task(self._receive_loop())
             # Start audio send loop
             self._send_task = asyncio.create_task(self._send_loop())
+            # Start keepalive (replacing any left over from a dropped connection)
+            if self._keepalive_task and not self._keepalive_task.done():
+                self._keepalive_task.cancel()
+            self._last_send_time = asyncio.get_running_loop().time()
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
             return True
 
         except Exception as e:
@@ -119,7 +152,7 @@ class DeepgramClient:
         # Send close frame to Deepgram
         if self.ws:
             try:
-                await self.ws.send(json.dumps({"type": "CloseStream"}))
+                await self.ws.send(_CLOSE_FRAME)
                 await self.ws.close()
             except Exception as e:
                 logger.warning(f"Error during Deepgram disconnect: {e}")
@@ -132,13 +165,14 @@ class DeepgramClient:
             except asyncio.CancelledError:
                 pass
 
-        # Cancel send task
-        if self._send_task and not self._send_task.done():
-            self._send_task.cancel()
-            try:
-                await self._send_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel send and keepalive tasks
+        for task in (self._send_task, self._keepalive_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         logger.info("Disconnected from Deepgram")
 
@@ -154,12 +188,11 @@ class DeepgramClient:
             return
 
         try:
-            # Non-blocking put with timeout
-            await asyncio.wait_for(self._audio_queue.put(audio_data), timeout=0.1)
-        except asyncio.TimeoutError:
+            # Non-blocking put: the bounded queue is the backpressure, so a
+            # full queue drops the chunk instead of stalling the caller
+            self._audio_queue.put_nowait(audio_data)
+        except asyncio.QueueFull:
             logger.warning("Audio queue full - dropping chunk to prevent blocking")
-        except Exception as e:
-            logger.error(f"Error queuing audio: {e}")
 
     async def finish_utterance(self):
         """
@@ -171,7 +204,7 @@ class DeepgramClient:
             return
             
         try:
-            await self.ws.send(json.dumps({"type": "FinishUtterance"}))
+            await self.ws.send(_FINISH_UTTERANCE_FRAME)
             logger.info("Sent FinishUtterance to Deepgram")
         except Exception as e:
             logger.error(f"Error sending FinishUtterance: {e}")
@@ -180,27 +213,31 @@ class DeepgramClient:
         """
         Continuously send audio from queue to Deepgram.
         
-        This prevents overwhelming the WebSocket with rapid sends.
+        Chunks that queued up while the previous send was in flight are
+        merged into one frame (linear16 concatenates transparently), so a
+        backlog costs one WebSocket frame instead of one per chunk.
         """
+        loop = asyncio.get_running_loop()
         try:
             while not self.is_closing:
                 try:
                     # Get audio chunk from queue (blocks until available)
-                    audio_data = await asyncio.wait_for(
-                        self._audio_queue.get(),
-                        timeout=5.0
-                    )
+                    audio_data = await self._audio_queue.get()
+                    
+                    # Coalesce whatever else is already queued
+                    if not self._audio_queue.empty():
+                        chunks = [audio_data]
+                        while len(chunks) < _MAX_COALESCED_CHUNKS:
+                            try:
+                                chunks.append(self._audio_queue.get_nowait())
+                            except asyncio.QueueEmpty:
+                                break
+                        audio_data = b"".join(chunks)
                     
                     if self.ws and self.is_connected:
                         await self.ws.send(audio_data)
+                        self._last_send_time = loop.time()
                         
-                except asyncio.TimeoutError:
-                    # No audio for 5 seconds - send keepalive
-                    if self.ws and self.is_connected:
-                        try:
-                            await self.ws.send(json.dumps({"type": "KeepAlive"}))
-                        except Exception:
-                            pass
                 except WebSocketException as e:
                     logger.error(f"Error sending audio to Deepgram: {e}")
                     self.is_connected = False
@@ -212,6 +249,28 @@ class DeepgramClient:
         except asyncio.CancelledError:
             logger.debug("Send loop cancelled")
 
+    async def _keepalive_loop(self):
+        """
+        Send KeepAlive whenever no audio has gone out for _KEEPALIVE_INTERVAL_S.
+        
+        Runs beside the send loop so the audio path never waits on a timer.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while not self.is_closing:
+                idle = loop.time() - self._last_send_time
+                if idle >= _KEEPALIVE_INTERVAL_S:
+                    if self.ws and self.is_connected:
+                        try:
+                            await self.ws.send(_KEEPALIVE_FRAME)
+                        except Exception:
+                            pass
+                    self._last_send_time = loop.time()
+                    idle = 0.0
+                await asyncio.sleep(_KEEPALIVE_INTERVAL_S - idle)
+        except asyncio.CancelledError:
+            logger.debug("Keepalive loop cancelled")
+
     async def _receive_loop(self):
         """
         Continuously receive and process messages from Deepgram.
@@ -226,10 +285,18 @@ class DeepgramClient:
                 if self.is_closing:
                     break
 
+                # Skip metadata/VAD events and empty transcripts unparsed
+                if (
+                    isinstance(message, str)
+                    and (_TRANSCRIPT_KEY not in message or _EMPTY_TRANSCRIPT in message)
+                    and _ERROR_KEY not in message
+                ):
+                    continue
+
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     await self._handle_message(data)
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Invalid JSON from Deepgram: {e}")
                 except Exception as e:
                     logger.error(f"Error handling Deepgram message: {e}")
@@ -2,18 +2,36 @@
 ElevenLabs streaming TTS client.
 
 Converts text to speech with streaming output and cancellation support.
+Whole turns stream over the input-streaming WebSocket; single texts (and the
+fallback when the WebSocket is unavailable) use the HTTP streaming endpoint.
 """
 
 import asyncio
 import logging
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, AsyncIterator, Optional
 import json
-import base64
+import httpx
+import orjson
+import pybase64
+from websockets import connect, WebSocketClientProtocol
 
+from app.clients import client_pool
+from app.utils.audio import encode_audio_base64
+from app.utils.cancel import CancelToken
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_API_ROOT = "https://api.elevenlabs.io/"
+
+_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+}
+
+# Input-streaming end-of-stream frame: server finishes the audio and sends isFinal
+_EOS_FRAME = orjson.dumps({"text": ""}).decode()
+
 
 class ElevenLabsClient:
     """
@@ -24,6 +42,8 @@ class ElevenLabsClient:
     - Base64 encoding for WebSocket transmission
     - Retry once on failure
     - Fallback to text-only on TTS failure
+    - Pooled keep-alive HTTP client shared by all sessions
+    - Input-streaming WebSocket per turn, opened ahead of time
     """
 
     def __init__(self):
@@ -31,69 +51,247 @@ class ElevenLabsClient:
         self.voice_id = settings.elevenlabs_voice_id
         self.model = "eleven_turbo_v2_5"  # Latest turbo model for lowest latency
 
+        # Request URL and headers are fixed for the lifetime of the client
+        self._stream_url = f"{_API_ROOT}v1/text-to-speech/{self.voice_id}/stream"
+        self._headers = {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "audio/mpeg",
+        }
+        self._ws_url = (
+            f"wss://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream-input"
+            f"?model_id={self.model}&inactivity_timeout=180"
+        )
+        self._bos_frame = orjson.dumps({"text": " ", "voice_settings": _VOICE_SETTINGS}).decode()
+
+        # Lease on the process-wide HTTP client
+        self._lease = client_pool.acquire("elevenlabs")
+
+        # Pre-opened WebSocket for the next turn (resolves to None on failure)
+        self._next_stream: Optional[asyncio.Task] = None
+
+        # Set by close(); no new WebSockets are opened after it
+        self._closed = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client."""
+        return self._lease.client
+
+    async def ping(self) -> bool:
+        """
+        Open (or refresh) the pooled connection to ElevenLabs.
+
+        Issues a cheap HEAD request so the TCP/TLS handshake happens before
+        the first sentence needs synthesizing. The response status is ignored.
+
+        Returns:
+            True if the connection was established, False otherwise
+        """
+        try:
+            await self._get_client().head(_API_ROOT)
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"ElevenLabs pre-warm failed: {e}")
+            return False
+
+    async def connect(self) -> bool:
+        """
+        Pre-open the input-streaming WebSocket for the first turn.
+
+        Falls back to pre-warming the HTTP connection if the WebSocket
+        cannot be opened.
+
+        Returns:
+            True if either connection was established, False otherwise
+        """
+        self.prepare_stream()
+        if self._next_stream and await asyncio.shield(self._next_stream) is not None:
+            return True
+        return await self.ping()
+
+    def prepare_stream(self):
+        """Start opening the next turn's WebSocket in the background (idempotent, no-op once closed)."""
+        if self._next_stream is None and not self._closed:
+            self._next_stream = asyncio.create_task(self._open_stream())
+
+    async def close(self):
+        """
+        Close the pre-opened WebSocket, if any, and return the pooled HTTP
+        client lease (called when the session ends).
+        """
+        self._closed = True
+        self._lease.release()
+        task, self._next_stream = self._next_stream, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return
+        ws = task.result()
+        if ws is not None:
+            await ws.close()
+
+    async def _open_stream(self) -> Optional[WebSocketClientProtocol]:
+        """
+        Open an input-streaming WebSocket and send the initial (BOS) frame.
+
+        Returns:
+            Open WebSocket, or None on failure
+        """
+        try:
+            ws = await connect(
+                self._ws_url,
+                extra_headers={"xi-api-key": self.api_key},
+                ping_interval=30,
+                ping_timeout=10,
+            )
+            await ws.send(self._bos_frame)
+            logger.debug("ElevenLabs input-streaming WebSocket opened")
+            return ws
+        except Exception as e:
+            logger.warning(f"Failed to open ElevenLabs WebSocket: {e}")
+            return None
+
+    async def _take_stream(self) -> Optional[WebSocketClientProtocol]:
+        """Take the pre-opened WebSocket, opening one now if none is usable."""
+        task, self._next_stream = self._next_stream, None
+        ws = await task if task is not None else None
+        if ws is None or ws.closed:
+            ws = await self._open_stream()
+        return ws
+
+    async def stream_sentences(
+        self,
+        sentences: AsyncIterator[str],
+        cancel: CancelToken,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Generate streaming audio for a turn whose text arrives sentence by sentence.
+
+        All sentences go over one WebSocket, so none of them pays a request
+        setup, and the next turn's socket is opened once this one finishes.
+        Falls back to one HTTP request per sentence if no socket can be opened.
+
+        Args:
+            sentences: Sentences in speaking order (ends when the turn's text does)
+            cancel: Token signalling cancellation
+
+        Yields:
+            Audio chunks as bytes (MP3)
+        """
+        ws = await self._take_stream()
+        if ws is None:
+            async for sentence in sentences:
+                async for chunk in self.generate_audio(sentence, cancel):
+                    yield chunk
+            return
+
+        sender = asyncio.create_task(self._send_sentences(ws, sentences))
+        chunk_index = 0
+        try:
+            async for message in ws:
+                # Check for cancellation
+                if cancel.cancelled:
+                    logger.info("TTS generation cancelled")
+                    return
+
+                data = orjson.loads(message)
+                audio = data.get("audio")
+                if audio:
+                    chunk = pybase64.b64decode(audio, validate=False)
+                    # Log first chunk to verify streaming
+                    if chunk_index == 0:
+                        logger.info(f"✅ TTS streaming: First audio chunk received ({len(chunk)} bytes)")
+                    chunk_index += 1
+                    yield chunk
+                elif "error" in data or "message" in data:
+                    logger.error(f"ElevenLabs WebSocket error: {data}")
+
+                if data.get("isFinal"):
+                    break
+
+            logger.info(f"TTS generation complete: {chunk_index} chunks")
+
+        finally:
+            if not sender.done():
+                sender.cancel()
+            try:
+                await sender
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Error sending text to ElevenLabs: {e}")
+            await ws.close()
+            self.prepare_stream()
+
+    async def _send_sentences(self, ws: WebSocketClientProtocol, sentences: AsyncIterator[str]):
+        """
+        Push sentences into an input-streaming WebSocket, then end the stream.
+
+        Each sentence is flushed so its audio is generated immediately. The
+        end-of-stream frame is always sent so the server emits isFinal.
+        """
+        try:
+            async for sentence in sentences:
+                await ws.send(orjson.dumps({"text": sentence + " ", "flush": True}).decode())
+        finally:
+            if not ws.closed:
+                await ws.send(_EOS_FRAME)
+
     async def generate_audio(
         self,
         text: str,
-        cancel_event: asyncio.Event,
+        cancel: CancelToken,
     ) -> AsyncGenerator[bytes, None]:
         """
         Generate streaming audio from text.
 
         Args:
             text: Text to convert to speech
-            cancel_event: Event to signal cancellation
+            cancel: Token signalling cancellation
 
         Yields:
             Audio chunks as bytes (PCM 16kHz mono)
         """
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream"
-        
         payload = {
             "text": text,
             "model_id": self.model,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-            }
-        }
-
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "audio/mpeg",
+            "voice_settings": _VOICE_SETTINGS,
         }
 
         try:
-            import aiohttp
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=5)
+            client = self._get_client()
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"ElevenLabs API error {response.status}: {error_text}")
+            async with client.stream(
+                "POST",
+                self._stream_url,
+                headers=self._headers,
+                json=payload
+            ) as response:
+                
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    logger.error(f"ElevenLabs API error {response.status_code}: {error_text}")
+                    return
+
+                # Stream audio chunks
+                chunk_index = 0
+                async for chunk in response.aiter_bytes():
+                    # Check for cancellation
+                    if cancel.cancelled:
+                        logger.info("TTS generation cancelled")
                         return
 
-                    # Stream audio chunks
-                    chunk_index = 0
-                    async for chunk in response.content.iter_chunked(4096):
-                        # Check for cancellation
-                        if cancel_event.is_set():
-                            logger.info("TTS generation cancelled")
-                            return
-
-                        if chunk:
-                            # Log first chunk to verify streaming
-                            if chunk_index == 0:
-                                logger.info(f"✅ TTS streaming: First audio chunk received ({len(chunk)} bytes)")
-                            chunk_index += 1
-                            yield chunk
+                    if chunk:
+                        # Log first chunk to verify streaming
+                        if chunk_index == 0:
+                            logger.info(f"✅ TTS streaming: First audio chunk received ({len(chunk)} bytes)")
+                        chunk_index += 1
+                        yield chunk
 
             logger.info(f"TTS generation complete: {chunk_index} chunks")
 
@@ -114,7 +312,7 @@ class ElevenLabsClient:
         Returns:
             Base64-encoded string
         """
-        return base64.b64encode(audio_bytes).decode('utf-8')
+        return encode_audio_base64(audio_bytes)
 
     async def test_connection(self) -> bool:
         """
@@ -124,20 +322,17 @@ class ElevenLabsClient:
             True if connection successful, False otherwise
         """
         try:
-            import aiohttp
-            
-            url = f"https://api.elevenlabs.io/v1/voices/{self.voice_id}"
+            url = f"{_API_ROOT}v1/voices/{self.voice_id}"
             headers = {"xi-api-key": self.api_key}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        voice_data = await response.json()
-                        logger.info(f"ElevenLabs voice verified: {voice_data.get('name', 'Unknown')}")
-                        return True
-                    else:
-                        logger.error(f"ElevenLabs voice check failed: {response.status}")
-                        return False
+            response = await self._get_client().get(url, headers=headers)
+            if response.status_code == 200:
+                voice_data = response.json()
+                logger.info(f"ElevenLabs voice verified: {voice_data.get('name', 'Unknown')}")
+                return True
+            else:
+                logger.error(f"ElevenLabs voice check failed: {response.status_code}")
+                return False
         except Exception as e:
             logger.error(f"ElevenLabs connection test failed: {e}")
             return False
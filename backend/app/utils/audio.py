@@ -1,11 +1,24 @@
 """Audio utilities for format conversion and buffering."""
 
+import asyncio
 import logging
-import base64
-from typing import Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, AsyncIterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pybase64
 
 logger = logging.getLogger(__name__)
 
+# Encoded audio at least this long is decoded on a worker thread. pybase64
+# releases the GIL, but below ~64KB (~60us of decoding) the executor
+# hand-off costs more than it saves.
+OFFLOAD_DECODE_MIN_CHARS = 65_536
+
+# Dedicated so decodes never queue behind embedding work in the default executor
+_decode_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-decode")
+
 
 def decode_audio_base64(audio_b64: str) -> Optional[bytes]:
     """
@@ -18,12 +31,39 @@ def decode_audio_base64(audio_b64: str) -> Optional[bytes]:
         Audio bytes or None on error
     """
     try:
-        return base64.b64decode(audio_b64)
+        # SIMD-accelerated decoder; accepts the ASCII str directly
+        return pybase64.b64decode(audio_b64, validate=False)
     except Exception as e:
         logger.error(f"Failed to decode base64 audio: {e}")
         return None
 
 
+def _decode_joined(chunks: Sequence[str]) -> bytes:
+    """Decode chunks and concatenate the ones that decoded."""
+    decoded = [decode_audio_base64(chunk) for chunk in chunks]
+    return b"".join(chunk for chunk in decoded if chunk)
+
+
+async def decode_audio_chunks(chunks: Sequence[str]) -> bytes:
+    """
+    Decode base64-encoded audio chunks and concatenate them.
+    
+    Large payloads (e.g. a reconnection backlog) are decoded on a worker
+    thread so the event loop stays responsive; typical 20-100ms frames are
+    decoded inline.
+    
+    Args:
+        chunks: Base64-encoded audio chunks, in order
+        
+    Returns:
+        Concatenated audio bytes (chunks that fail to decode are skipped)
+    """
+    if sum(map(len, chunks)) < OFFLOAD_DECODE_MIN_CHARS:
+        return _decode_joined(chunks)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_decode_pool, _decode_joined, chunks)
+
+
 def encode_audio_base64(audio_bytes: bytes) -> str:
     """
     Encode audio bytes to base64.
@@ -34,19 +74,114 @@ def encode_audio_base64(audio_bytes: bytes) -> str:
     Returns:
         Base64-encoded string
     """
-    return base64.b64encode(audio_bytes).decode('utf-8')
+    # SIMD-accelerated encoder; returns str without a bytes round trip
+    return pybase64.b64encode_as_string(audio_bytes)
+
+
+def mean_abs_amplitude(pcm: bytes) -> float:
+    """
+    Compute the mean absolute sample value of 16-bit little-endian PCM.
+    
+    Cheap energy measure used to gate audio forwarding (0 = silence,
+    32768 = full scale).
+    
+    Args:
+        pcm: Raw PCM16 audio data
+        
+    Returns:
+        Mean absolute amplitude, 0.0 for empty input
+    """
+    samples = np.frombuffer(pcm, dtype='<i2', count=len(pcm) // 2)
+    if not samples.size:
+        return 0.0
+    # Widen before abs: abs(-32768) overflows int16
+    return float(np.abs(samples.astype(np.int32)).mean())
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[bytes],
+    target_size: int = 12_288,
+    max_delay_s: float = 0.05,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Merge small streamed audio chunks into frames of about target_size bytes.
+    
+    The first chunk passes straight through (first-audio latency). Later
+    chunks are held until target_size bytes have accumulated or no new chunk
+    arrives within max_delay_s (the gap after a sentence's audio), so no
+    audio is ever held back longer than max_delay_s.
+    
+    Args:
+        chunks: Source audio stream
+        target_size: Frame size to accumulate before emitting
+        max_delay_s: Longest wait for more audio before emitting a partial frame
+        
+    Yields:
+        Audio frames (concatenated chunks, original order)
+    """
+    source = aiter(chunks)
+    pending = bytearray()
+    next_chunk: Optional[asyncio.Future] = None
+    first = True
+    try:
+        while True:
+            if next_chunk is None:
+                next_chunk = asyncio.ensure_future(anext(source))
+
+            # Frame partly filled: emit it if the stream goes quiet
+            if pending and not next_chunk.done():
+                await asyncio.wait((next_chunk,), timeout=max_delay_s)
+                if not next_chunk.done():
+                    yield bytes(pending)
+                    pending.clear()
+                    continue
+
+            try:
+                chunk = await next_chunk
+            except StopAsyncIteration:
+                break
+            finally:
+                next_chunk = None
+
+            if first:
+                first = False
+                yield chunk
+                continue
+
+            pending += chunk
+            if len(pending) >= target_size:
+                yield bytes(pending)
+                pending.clear()
+
+        if pending:
+            yield bytes(pending)
+    finally:
+        # Don't leave the source generator running when closed early
+        if next_chunk is not None and not next_chunk.done():
+            next_chunk.cancel()
+            try:
+                await next_chunk
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
 
 
 class AudioBuffer:
     """
     Circular buffer for audio chunks with overflow protection.
     
-    Max 30 seconds of audio at 16kHz mono (960KB).
+    Max 30 seconds of audio at 16kHz mono (960KB). The storage is an int16
+    sample array allocated once (on first add) and written in place through
+    a byte view with wraparound, so steady-state appends never reallocate or
+    shift the retained audio, and as_int16() can hand samples to numpy
+    consumers without a copy.
     """
 
     def __init__(self, max_duration_seconds: int = 30, sample_rate: int = 16000):
         self.max_size = max_duration_seconds * sample_rate * 2  # 2 bytes per sample (16-bit)
-        self.buffer: bytearray = bytearray()
+        self._samples: Optional[np.ndarray] = None  # Ring storage (int16, allocated on first add)
+        self.buffer: Optional[memoryview] = None  # Writable byte view of _samples
+        self._write = 0  # Next write position in the ring
+        self._valid = 0  # Bytes of buffered audio (<= max_size)
         self.total_bytes_received = 0
 
     def add(self, audio_chunk: bytes):
@@ -58,13 +193,32 @@ class AudioBuffer:
         Args:
             audio_chunk: Audio data to add
         """
-        self.buffer.extend(audio_chunk)
-        self.total_bytes_received += len(audio_chunk)
+        n = len(audio_chunk)
+        if not n:
+            return
+        if self.buffer is None:
+            self._samples = np.zeros(self.max_size // 2, dtype=np.int16)
+            self.buffer = memoryview(self._samples).cast("B")
+        self.total_bytes_received += n
+        overflow = self._valid + n - self.max_size
+
+        chunk = memoryview(audio_chunk)
+        if n >= self.max_size:
+            # Only the newest max_size bytes survive
+            self.buffer[:] = chunk[n - self.max_size:]
+            self._write = 0
+        else:
+            # Write up to the end of the ring, wrap the rest to the start
+            w = self._write
+            first = min(n, self.max_size - w)
+            self.buffer[w:w + first] = chunk[:first]
+            if first < n:
+                self.buffer[:n - first] = chunk[first:]
+            self._write = (w + n) % self.max_size
+        self._valid = min(self._valid + n, self.max_size)
 
-        # Drop oldest data if over limit
-        if len(self.buffer) > self.max_size:
-            overflow = len(self.buffer) - self.max_size
-            self.buffer = self.buffer[overflow:]
+        # Oldest data was overwritten
+        if overflow > 0:
             logger.warning(f"Audio buffer overflow: dropped {overflow} bytes")
 
     def get_all(self) -> bytes:
@@ -72,18 +226,72 @@ class AudioBuffer:
         Get all buffered audio.
         
         Returns:
-            All audio data as bytes
+            All audio data as bytes (oldest first)
         """
-        return bytes(self.buffer)
+        if self.buffer is None:
+            return b""
+        start = (self._write - self._valid) % self.max_size
+        view = self.buffer
+        if start + self._valid <= self.max_size:
+            return bytes(view[start:start + self._valid])
+        return b"".join((view[start:], view[:self._write]))
+
+    def as_int16(self) -> np.ndarray:
+        """
+        Get all buffered audio as int16 samples.
+        
+        A view into the ring (no copy) unless the buffered audio wraps past
+        its end, in which case the two segments are concatenated. Assumes
+        chunks hold whole samples (even byte counts), as PCM16 chunks do.
+        
+        Returns:
+            Samples (oldest first); a view must not be kept across add()
+        """
+        segments = self._sample_segments()
+        if not segments:
+            return np.zeros(0, dtype=np.int16)
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
+
+    def rms(self) -> float:
+        """
+        Compute the root-mean-square amplitude of the buffered audio.
+        
+        One BLAS dot product per ring segment, so wrapped audio is never
+        concatenated. Samples are widened to float64 first (int16 products
+        overflow).
+        
+        Returns:
+            RMS amplitude (0 = silence, 32768 = full scale), 0.0 when empty
+        """
+        total = 0.0
+        count = 0
+        for segment in self._sample_segments():
+            x = segment.astype(np.float64)
+            total += float(np.dot(x, x))
+            count += x.size
+        return math.sqrt(total / count) if count else 0.0
+
+    def _sample_segments(self) -> Tuple[np.ndarray, ...]:
+        """Views of the buffered samples, oldest first (two if the ring wraps)."""
+        if self._samples is None or not self._valid:
+            return ()
+        start = (self._write - self._valid) % self.max_size // 2
+        end = start + self._valid // 2
+        if end <= self._samples.size:
+            return (self._samples[start:end],)
+        return (self._samples[start:], self._samples[:self._write // 2])
 
     def clear(self):
         """Clear the buffer."""
-        self.buffer.clear()
+        self._write = 0
+        self._valid = 0
         logger.debug("Audio buffer cleared")
 
     def size_bytes(self) -> int:
         """Get current buffer size in bytes."""
-        return len(self.buffer)
+        return self._valid
 
     def duration_seconds(self, sample_rate: int = 16000) -> float:
         """
@@ -95,5 +303,5 @@ class AudioBuffer:
         Returns:
             Duration in seconds
         """
-        num_samples = len(self.buffer) // 2  # 16-bit = 2 bytes per sample
+        num_samples = self._valid // 2  # 16-bit = 2 bytes per sample
         return num_samples / sample_rate
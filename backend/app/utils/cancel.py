@@ -0,0 +1,21 @@
+"""Cancellation flags for LLM and TTS runs."""
+
+
+class CancelToken:
+    """
+    One-shot cancellation flag for a single LLM or TTS run.
+
+    A plain attribute instead of asyncio.Event: nothing ever waits for
+    cancellation, so checking it in a stream loop is one attribute read.
+    Tokens are never reset - each run gets a fresh one - so a straggling
+    task from a cancelled run stays cancelled when the next run starts.
+    """
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        """Signal cancellation to everything holding this token."""
+        self.cancelled = True
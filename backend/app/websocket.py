@@ -7,6 +7,7 @@ import logging
 import uuid
 import time
 from typing import Dict, Optional
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from app.models import (
@@ -19,6 +20,9 @@ from app.state_machine import TurnState
 
 logger = logging.getLogger(__name__)
 
+# Serialized '{"type":<type>,"data":' prefixes, filled in on first use per type
+_ENVELOPE_PREFIXES: Dict[str, str] = {}
+
 
 class ConnectionManager:
     """
@@ -124,6 +128,50 @@ class ConnectionManager:
             session_id: Target session ID
             message: Message dict to send
             
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        # Serialize with orjson; sent as a text frame since clients JSON.parse it
+        return await self._send_text(
+            session_id,
+            orjson.dumps(message).decode(),
+            message.get("type", "unknown"),
+        )
+    
+    async def send_event(self, session_id: str, message_type: str, data: dict) -> bool:
+        """
+        Send a {"type": ..., "data": ...} message to specific session.
+        
+        The constant envelope is serialized once per message type, so only
+        the data payload is serialized per call.
+        
+        Args:
+            session_id: Target session ID
+            message_type: Message type
+            data: Message data payload
+            
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        prefix = _ENVELOPE_PREFIXES.get(message_type)
+        if prefix is None:
+            prefix = '{"type":' + orjson.dumps(message_type).decode() + ',"data":'
+            _ENVELOPE_PREFIXES[message_type] = prefix
+        return await self._send_text(
+            session_id,
+            prefix + orjson.dumps(data).decode() + "}",
+            message_type,
+        )
+    
+    async def _send_text(self, session_id: str, text: str, message_type: str) -> bool:
+        """
+        Send a serialized JSON message to specific session.
+        
+        Args:
+            session_id: Target session ID
+            text: Serialized message
+            message_type: Message type (for logging)
+            
         Returns:
             True if sent successfully, False otherwise
         """
@@ -134,13 +182,13 @@ class ConnectionManager:
         websocket = self.active_connections[session_id]
         
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(text)
             
             # Update message count
             if session_id in self.session_metadata:
                 self.session_metadata[session_id]["total_messages"] += 1
             
-            logger.debug(f"Message sent to session {session_id}: type={message.get('type', 'unknown')}")
+            logger.debug(f"Message sent to session {session_id}: type={message_type}")
             return True
             
         except WebSocketDisconnect:
@@ -160,13 +208,14 @@ class ConnectionManager:
             exclude_session: Optional session ID to exclude from broadcast
         """
         disconnected_sessions = []
+        message_text = orjson.dumps(message).decode()
         
         for session_id, websocket in self.active_connections.items():
             if exclude_session and session_id == exclude_session:
                 continue
             
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(message_text)
                 
                 # Update message count
                 if session_id in self.session_metadata:
@@ -0,0 +1,159 @@
+"""
+Unit tests for audio utilities.
+
+Tests coalescing of streamed audio chunks and the circular AudioBuffer.
+"""
+
+import pytest
+import asyncio
+import numpy as np
+import pybase64
+from app.utils.audio import (
+    OFFLOAD_DECODE_MIN_CHARS,
+    AudioBuffer,
+    coalesce_chunks,
+    decode_audio_chunks,
+)
+
+
+async def _stream(chunks, gap_after=None, gap_s=0.0):
+    """Yield chunks, pausing for gap_s after the indices in gap_after."""
+    for i, chunk in enumerate(chunks):
+        yield chunk
+        if gap_after and i in gap_after:
+            await asyncio.sleep(gap_s)
+
+
+class TestCoalesceChunks:
+    """Test audio chunk coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_passes_through(self):
+        """Test the first chunk is emitted alone and the rest are merged."""
+        chunks = [b"a" * 100, b"b" * 100, b"c" * 100, b"d" * 100]
+        frames = [f async for f in coalesce_chunks(_stream(chunks), target_size=250)]
+
+        assert frames[0] == b"a" * 100
+        assert frames[1] == b"b" * 100 + b"c" * 100 + b"d" * 100
+        assert b"".join(frames) == b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_emits_at_target_size(self):
+        """Test a frame is emitted once target_size bytes have accumulated."""
+        chunks = [b"x"] + [b"y" * 100] * 6
+        frames = [f async for f in coalesce_chunks(_stream(chunks), target_size=300)]
+
+        assert [len(f) for f in frames] == [1, 300, 300]
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_stream_goes_quiet(self):
+        """Test a partial frame is emitted when no chunk arrives within max_delay_s."""
+        chunks = [b"1", b"2", b"3", b"4"]
+        stream = _stream(chunks, gap_after={2}, gap_s=0.1)
+        frames = [f async for f in coalesce_chunks(stream, target_size=1000, max_delay_s=0.02)]
+
+        assert frames == [b"1", b"23", b"4"]
+
+    @pytest.mark.asyncio
+    async def test_close_early_stops_source(self):
+        """Test closing the coalescer mid-stream leaves no source read running."""
+        async def endless():
+            while True:
+                yield b"z" * 10
+                await asyncio.sleep(0.01)
+
+        frames = coalesce_chunks(endless(), target_size=1000, max_delay_s=0.05)
+        assert await anext(frames) == b"z" * 10
+        await frames.aclose()
+
+
+class TestDecodeAudioChunks:
+    """Test base64 audio chunk decoding."""
+
+    @pytest.mark.asyncio
+    async def test_small_chunks_joined(self):
+        """Test chunks decode and concatenate in order."""
+        chunks = [pybase64.b64encode_as_string(b) for b in (b"ab", b"cd", b"ef")]
+        assert await decode_audio_chunks(chunks) == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_large_payload_decoded_on_worker(self):
+        """Test a payload over the threshold decodes identically off the loop."""
+        raw = bytes(range(256)) * (OFFLOAD_DECODE_MIN_CHARS // 256 + 1)
+        encoded = pybase64.b64encode_as_string(raw)
+        assert len(encoded) >= OFFLOAD_DECODE_MIN_CHARS
+        assert await decode_audio_chunks([encoded]) == raw
+
+
+class TestAudioBuffer:
+    """Test circular audio buffer functionality."""
+
+    def _buffer(self, max_size: int) -> AudioBuffer:
+        """Create a buffer holding max_size bytes (1s at max_size/2 Hz)."""
+        return AudioBuffer(max_duration_seconds=1, sample_rate=max_size // 2)
+
+    def test_add_and_get_all(self):
+        """Test chunks come back concatenated in order."""
+        buffer = self._buffer(10)
+        buffer.add(b"abc")
+        buffer.add(b"def")
+
+        assert buffer.get_all() == b"abcdef"
+        assert buffer.size_bytes() == 6
+
+    def test_overflow_keeps_newest_data(self):
+        """Test the oldest bytes are dropped across the wraparound."""
+        buffer = self._buffer(8)
+        buffer.add(b"abcdef")
+        buffer.add(b"ghij")
+
+        assert buffer.get_all() == b"cdefghij"
+        buffer.add(b"kl")
+        assert buffer.get_all() == b"efghijkl"
+        assert buffer.total_bytes_received == 12
+
+    def test_chunk_larger_than_buffer(self):
+        """Test an oversized chunk leaves only its newest max_size bytes."""
+        buffer = self._buffer(4)
+        buffer.add(b"ab")
+        buffer.add(b"0123456789")
+
+        assert buffer.get_all() == b"6789"
+        buffer.add(b"x")
+        assert buffer.get_all() == b"789x"
+
+    def test_clear(self):
+        """Test clear() empties the buffer for reuse."""
+        buffer = self._buffer(6)
+        buffer.add(b"abcd")
+        buffer.clear()
+
+        assert buffer.get_all() == b""
+        assert buffer.duration_seconds() == 0.0
+        buffer.add(b"xyz")
+        assert buffer.get_all() == b"xyz"
+
+    def test_as_int16(self):
+        """Test samples come back as int16, as a view until the ring wraps."""
+        buffer = self._buffer(8)
+        assert buffer.as_int16().size == 0
+
+        buffer.add(np.array([1, -2, 3], dtype="<i2").tobytes())
+        samples = buffer.as_int16()
+        assert samples.tolist() == [1, -2, 3]
+        assert np.shares_memory(samples, buffer._samples)
+
+        buffer.add(np.array([4, 5], dtype="<i2").tobytes())
+        assert buffer.as_int16().tolist() == [-2, 3, 4, 5]
+
+    def test_rms(self):
+        """Test RMS over the ring matches a direct computation, wrapped or not."""
+        buffer = self._buffer(8)
+        assert buffer.rms() == 0.0
+
+        buffer.add(np.array([30000, -30000, 3], dtype="<i2").tobytes())
+        assert buffer.rms() == pytest.approx(np.sqrt((2 * 30000**2 + 9) / 3))
+
+        buffer.add(np.array([4, 5], dtype="<i2").tobytes())
+        expected = np.array([-30000, 3, 4, 5], dtype=np.float64)
+        assert buffer.rms() == pytest.approx(np.sqrt(np.mean(expected ** 2)))
@@ -0,0 +1,66 @@
+"""
+Unit tests for ConversationHistory.
+
+Tests the append-only prompt window that keeps prompt-cache prefixes stable.
+"""
+
+import pytest
+from app.orchestration.conversation_history import ConversationHistory
+
+
+def _contents(messages):
+    return [m["content"] for m in messages]
+
+
+class TestConversationHistory:
+    """Test conversation history functionality."""
+
+    def test_add_turn(self):
+        """Test a turn adds user then assistant messages."""
+        history = ConversationHistory()
+        history.add_turn("Hi", "Hello!")
+
+        assert history.get_messages() == [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+
+    def test_window_is_append_only_until_limit(self):
+        """Test each window extends the previous one below 2x the limit."""
+        history = ConversationHistory(window_messages=4)
+        previous = []
+
+        for i in range(3):
+            history.add_turn(f"u{i}", f"a{i}")
+            window = history.get_window()
+            assert window[:len(previous)] == previous
+            previous = window
+
+        assert len(previous) == 6
+
+    def test_window_jumps_forward_at_twice_limit(self):
+        """Test the window snaps to the newest messages at 2x the limit."""
+        history = ConversationHistory(window_messages=4)
+        for i in range(4):
+            history.add_turn(f"u{i}", f"a{i}")
+
+        assert _contents(history.get_window()) == ["u2", "a2", "u3", "a3"]
+        assert len(history.get_messages()) == 8
+
+    def test_no_window_returns_everything(self):
+        """Test history without a window limit returns all messages."""
+        history = ConversationHistory()
+        for i in range(30):
+            history.add_turn(f"u{i}", f"a{i}")
+
+        assert len(history.get_window()) == 60
+
+    def test_clear_resets_window(self):
+        """Test clear() empties history and restarts the window."""
+        history = ConversationHistory(window_messages=2)
+        for i in range(3):
+            history.add_turn(f"u{i}", f"a{i}")
+        history.clear()
+        history.add_turn("new", "turn")
+
+        assert _contents(history.get_window()) == ["new", "turn"]
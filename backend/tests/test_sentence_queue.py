@@ -0,0 +1,53 @@
+"""
+Unit tests for SentenceQueue.
+
+Tests FIFO ordering, waiting consumers and O(1) draining.
+"""
+
+import pytest
+import asyncio
+from app.orchestration.sentence_queue import SentenceQueue
+
+
+class TestSentenceQueue:
+    """Test sentence queue functionality."""
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        """Test items come out in the order they were put."""
+        queue = SentenceQueue()
+        queue.put_nowait(("First.", False))
+        queue.put_nowait(("Second.", True))
+
+        assert len(queue) == 2
+        assert await queue.get() == ("First.", False)
+        assert await queue.get() == ("Second.", True)
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_item(self):
+        """Test get() blocks until an item is put."""
+        queue = SentenceQueue()
+        getter = asyncio.create_task(queue.get())
+
+        await asyncio.sleep(0.01)
+        assert not getter.done()
+
+        queue.put_nowait(("Hello.", False))
+        assert await asyncio.wait_for(getter, timeout=1.0) == ("Hello.", False)
+
+    @pytest.mark.asyncio
+    async def test_drain(self):
+        """Test drain() discards queued items and a later get() waits."""
+        queue = SentenceQueue()
+        queue.put_nowait(("Stale one.", False))
+        queue.put_nowait(("Stale two.", True))
+
+        queue.drain()
+        assert queue.empty()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), timeout=0.05)
+
+        queue.put_nowait(("Fresh.", True))
+        assert await queue.get() == ("Fresh.", True)
@@ -0,0 +1,54 @@
+"""
+Unit tests for SentenceSplitter.
+
+Tests incremental boundary detection across token splits.
+"""
+
+from app.llm.sentence_splitter import SentenceSplitter
+
+
+class TestSentenceSplitter:
+    """Test sentence splitter functionality."""
+
+    def test_no_boundary_buffers_text(self):
+        """Test tokens without a boundary are held back."""
+        splitter = SentenceSplitter()
+
+        assert splitter.try_emit("Hello") == []
+        assert splitter.try_emit(" there") == []
+        assert splitter.flush() == "Hello there"
+
+    def test_boundary_split_across_tokens(self):
+        """Test punctuation and the following space may arrive in different tokens."""
+        splitter = SentenceSplitter()
+
+        assert splitter.try_emit("Hello there") == []
+        assert splitter.try_emit(".") == []
+        assert splitter.try_emit(" How") == ["Hello there."]
+        assert splitter.try_emit(" are you?") == []
+        assert splitter.flush() == "How are you?"
+
+    def test_multiple_sentences_in_one_token(self):
+        """Test every sentence completed by a token is emitted."""
+        splitter = SentenceSplitter()
+
+        assert splitter.try_emit("Yes. No! Maybe? So") == ["Yes.", "No!", "Maybe?"]
+        assert splitter.flush() == "So"
+
+    def test_punctuation_inside_words_is_not_a_boundary(self):
+        """Test .!? not followed by whitespace stays inside the sentence."""
+        splitter = SentenceSplitter()
+
+        assert splitter.try_emit("Pi is 3.") == []
+        assert splitter.try_emit("14, see example.com") == []
+        assert splitter.try_emit("?! Next") == ["Pi is 3.14, see example.com?!"]
+
+    def test_flush_resets_state(self):
+        """Test flush() empties the splitter for reuse."""
+        splitter = SentenceSplitter()
+
+        splitter.try_emit("Done.")
+        assert splitter.flush() == "Done."
+
+        assert splitter.try_emit(" Fresh start. ") == ["Fresh start."]
+        assert splitter.flush() == ""
@@ -0,0 +1,63 @@
+"""
+Unit tests for TurnScope.
+
+Tests one-call teardown of a response's tasks and sentence queue.
+"""
+
+import pytest
+import asyncio
+from app.orchestration.turn_scope import TurnScope
+
+
+class TestTurnScope:
+    """Test turn scope functionality."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_all_tasks(self):
+        """Test cancel() cancels every task without awaiting them."""
+        scope = TurnScope()
+        llm = scope.create_task(asyncio.sleep(10))
+        tts = scope.create_task(asyncio.sleep(10))
+        await asyncio.sleep(0)
+        assert len(scope) == 2
+
+        scope.cancel()
+        assert scope.cancelled
+
+        results = await asyncio.gather(llm, tts, return_exceptions=True)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert len(scope) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_drains_sentences(self):
+        """Test queued sentences are discarded with the scope."""
+        scope = TurnScope()
+        scope.sentences.put_nowait(("Stale.", False))
+
+        scope.cancel()
+        assert scope.sentences.empty()
+
+    @pytest.mark.asyncio
+    async def test_task_created_after_cancel_is_cancelled(self):
+        """Test a late task spawned into a cancelled scope never runs."""
+        scope = TurnScope()
+        scope.cancel()
+
+        task = scope.create_task(asyncio.sleep(10))
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_task_can_cancel_own_scope(self):
+        """Test a task cancelling its own scope stops its siblings only."""
+        scope = TurnScope()
+        sibling = scope.create_task(asyncio.sleep(10))
+
+        async def canceller():
+            scope.cancel()
+            await asyncio.sleep(0)
+            return "finished"
+
+        assert await scope.create_task(canceller()) == "finished"
+        with pytest.raises(asyncio.CancelledError):
+            await sibling
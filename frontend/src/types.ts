@@ -135,6 +135,7 @@ export interface TurnCompleteMessage {
     agent_text: string;
     duration_ms: number;
     was_interrupted: boolean;
+    timings?: Record<string, number>;
     timestamp: number;
   };
 }
@@ -143,6 +144,7 @@ export interface TelemetryMessage {
   type: "telemetry";
   data: {
     cancellation_rate: number;
+    cancellation_rate_ewma?: number;
     avg_debounce_ms: number;
     turn_latency_ms: number;
     total_turns: number;